@@ -8,6 +8,8 @@ import hashlib
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import websocket
 import threading
 from typing import Dict, List, Optional
@@ -17,6 +19,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) seconds; a stalled exchange call would otherwise hold a
+# web request or the trading loop indefinitely
+REQUEST_TIMEOUT = (3.05, 10)
+
 class OrderSide(Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -66,19 +72,28 @@ class CryptoComAPI:
         self.ws_market = None
         self.request_id = 1
         self._session = requests.Session()
+        # Web requests and the ticker pool call in concurrently; give each a
+        # keep-alive connection instead of queueing on the default pool of 10.
+        # Retries cover failed connects and GET reads only (urllib3's default
+        # allowed_methods), so an order POST is never sent twice
+        self._session.mount("https://", HTTPAdapter(
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        ))
         
-        # Rate limiting
+        # Rate limiting; the lock also keeps request ids unique across threads
+        self._request_lock = threading.Lock()
         self._last_request_time = 0
         self._min_request_interval = 0.1  # 100ms between requests
     
-    def _generate_signature(self, method: str, params: Dict) -> str:
+    def _generate_signature(self, method: str, params: Dict, request_id: int) -> str:
         """Generate HMAC-SHA256 signature for authenticated requests"""
         param_str = ""
         if params:
             param_str = self._params_to_str(params, 0)
         
         nonce = int(time.time() * 1000)
-        payload_str = f"{method}{self.request_id}{self.api_key}{param_str}{nonce}"
+        payload_str = f"{method}{request_id}{self.api_key}{param_str}{nonce}"
         
         signature = hmac.new(
             self.secret_key.encode('utf-8'),
@@ -105,22 +120,33 @@ class CryptoComAPI:
                 return_str += str(obj[key])
         return return_str
     
-    def _rate_limit(self):
-        """Implement rate limiting"""
-        now = time.time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            time.sleep(self._min_request_interval - time_since_last)
-        self._last_request_time = time.time()
+    def _rate_limit(self) -> int:
+        """
+        Implement rate limiting
+        
+        Callers reserve the next send slot and request id under the lock, then
+        wait outside it, so concurrent requests keep the spacing without
+        serializing their round trips.
+        """
+        with self._request_lock:
+            now = time.time()
+            send_at = max(now, self._last_request_time + self._min_request_interval)
+            self._last_request_time = send_at
+            request_id = self.request_id
+            self.request_id += 1
+        
+        if send_at > now:
+            time.sleep(send_at - now)
+        return request_id
     
     def _make_request(self, method: str, endpoint: str, params: Dict = None, auth: bool = False) -> Dict:
         """Make REST API request"""
-        self._rate_limit()
+        request_id = self._rate_limit()
         
         url = f"{self.rest_url}/{endpoint}"
         
         payload = {
-            "id": self.request_id,
+            "id": request_id,
             "method": method
         }
         
@@ -129,22 +155,21 @@ class CryptoComAPI:
         
         if auth:
             payload["api_key"] = self.api_key
-            signature, nonce = self._generate_signature(method, params or {})
+            signature, nonce = self._generate_signature(method, params or {}, request_id)
             payload["sig"] = signature
             payload["nonce"] = nonce
         
-        self.request_id += 1
-        
         try:
             if method.startswith("public/"):
                 # GET request for public endpoints
-                response = self._session.get(url, params=payload.get("params", {}))
+                response = self._session.get(url, params=payload.get("params", {}), timeout=REQUEST_TIMEOUT)
             else:
                 # POST request for private endpoints
                 response = self._session.post(
                     url, 
                     json=payload, 
-                    headers={"Content-Type": "application/json"}
+                    headers={"Content-Type": "application/json"},
+                    timeout=REQUEST_TIMEOUT
                 )
             
             response.raise_for_status()
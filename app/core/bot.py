@@ -9,6 +9,9 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 from ..api.crypto_com_api import CryptoComAPI, OrderRequest, OrderSide, OrderType
 from ..strategies.base_strategy import BaseStrategy, MarketData, SignalType
@@ -18,6 +21,25 @@ from ..utils.logger import TradingLogger
 
 logger = logging.getLogger(__name__)
 
+MARKET_PAIRS = [
+    'BTCUSD-PERP', 'ETHUSD-PERP', 'ADAUSD-PERP', 'SOLUSD-PERP',
+    'DOTUSD-PERP', 'LINKUSD-PERP', 'AVAXUSD-PERP', 'MATICUSD-PERP'
+]
+
+DEMO_MARKET_PRICES = {
+    'BTCUSD-PERP': {'price': 100000, 'change': 2.5, 'volume': 1234567},
+    'ETHUSD-PERP': {'price': 2630, 'change': -1.2, 'volume': 987654},
+    'ADAUSD-PERP': {'price': 0.45, 'change': 3.1, 'volume': 456789},
+    'SOLUSD-PERP': {'price': 185.50, 'change': -0.8, 'volume': 234567},
+    'DOTUSD-PERP': {'price': 7.25, 'change': 1.5, 'volume': 123456},
+    'LINKUSD-PERP': {'price': 15.80, 'change': -2.1, 'volume': 789012},
+    'AVAXUSD-PERP': {'price': 42.30, 'change': 4.2, 'volume': 345678},
+    'MATICUSD-PERP': {'price': 0.85, 'change': 0.7, 'volume': 567890}
+}
+
+# Display endpoints (status, balance, holdings, risk) share one exchange balance read per window
+BALANCE_TTL = 1.0
+
 class TradingBot:
     """Main trading bot orchestrator"""
     
@@ -27,19 +49,29 @@ class TradingBot:
         self.api = None
         self.api_client = None  # Add alias for compatibility
         self.strategies = {}
+        self.strategy_methods = {}  # name -> optional strategy methods (bound, or None)
         self.active_strategies = []
         self.positions = {}
         self.market_data = {}
+        self.market_data_prices = {}  # instrument -> latest close, for price-only readers
         
         # Threading
         self.trading_thread = None
         self.market_data_thread = None
+        self._market_data_pool = None  # Ticker fetch workers; created in start(), shut down in stop()
+        self._state_lock = threading.RLock()  # Guards positions, counters and history
+        self._balance_lock = threading.Lock()
+        self._balance_cache = None  # (monotonic fetch time, balance dict)
+        # Set on start/stop, trades and market data updates; the web layer
+        # broadcasts status and positions when it is set instead of polling
+        self.state_changed = threading.Event()
         
         # Performance tracking
         self.total_trades = 0
         self.winning_trades = 0
         self.total_pnl = 0.0
         self.trading_history = []
+        self.trading_history_json = []  # each trading_history entry, already encoded for exports
         
         # Logging
         self.trade_logger = TradingLogger("TradingBot")
@@ -80,12 +112,36 @@ class TradingBot:
                 if name in self.strategies
             ]
             
+            self._index_strategy_methods()
+            
             logger.info(f"Initialized {len(self.strategies)} strategies, {len(self.active_strategies)} active")
             
         except Exception as e:
             logger.error(f"Failed to initialize strategies: {e}")
             raise
     
+    def _record_trade(self, trade: Dict):
+        """
+        Append a trade to the history along with its encoded form and flag the
+        state change; call with _state_lock held, after updating positions
+        """
+        self.trading_history.append(trade)
+        self.trading_history_json.append(
+            orjson.dumps(trade, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        )
+        self.state_changed.set()
+    
+    def _index_strategy_methods(self):
+        """Resolve each strategy's optional methods once so the API can dispatch with a dict read"""
+        self.strategy_methods = {
+            name: {
+                'signal_history': getattr(strategy, 'get_signal_history', None),
+                'optimize_parameters': getattr(strategy, 'optimize_parameters', None),
+                'risk_metrics': getattr(strategy, 'get_risk_metrics', None)
+            }
+            for name, strategy in self.strategies.items()
+        }
+    
     def start(self):
         """Start the trading bot"""
         if self.running:
@@ -97,8 +153,12 @@ class TradingBot:
             raise ValueError("Invalid configuration")
         
         self.running = True
+        self.state_changed.set()
         logger.info("Starting CryptoBot Pro...")
         
+        self._market_data_pool = ThreadPoolExecutor(max_workers=len(MARKET_PAIRS),
+                                                    thread_name_prefix="market-data")
+        
         # Start market data feed
         self.market_data_thread = threading.Thread(target=self._market_data_loop, daemon=True)
         self.market_data_thread.start()
@@ -117,6 +177,7 @@ class TradingBot:
         
         logger.info("Stopping CryptoBot Pro...")
         self.running = False
+        self.state_changed.set()
         
         # Wait for threads to finish
         if self.trading_thread and self.trading_thread.is_alive():
@@ -125,6 +186,11 @@ class TradingBot:
         if self.market_data_thread and self.market_data_thread.is_alive():
             self.market_data_thread.join(timeout=5)
         
+        # Release the ticker workers; a fetch still in flight falls back to demo data
+        if self._market_data_pool:
+            self._market_data_pool.shutdown(wait=False, cancel_futures=True)
+            self._market_data_pool = None
+        
         # Close API connections
         if self.api:
             self.api.close()
@@ -159,12 +225,14 @@ class TradingBot:
                         
                         # Store market data
                         self.market_data[instrument] = market_data
+                        self.market_data_prices[instrument] = market_data.close
+                        self.state_changed.set()
                         
                         # Update all strategies
                         for strategy in self.strategies.values():
                             strategy.update_market_data(market_data)
                         
-                        logger.debug(f"Updated market data for {instrument}: ${market_data.close}")
+                        logger.debug("Updated market data for %s: $%s", instrument, market_data.close)
                 
                 time.sleep(5)  # Update every 5 seconds
                 
@@ -247,26 +315,27 @@ class TradingBot:
                 success = result.get("code") == 0
             
             if success:
-                # Record position
-                self.positions[instrument] = {
-                    'side': 'BUY',
-                    'quantity': position_size,
-                    'entry_price': signal.price,
-                    'strategy': strategy.name,
-                    'timestamp': time.time()
-                }
-                
-                # Record trade in history
-                self.trading_history.append({
-                    'timestamp': datetime.now(),
-                    'instrument': instrument,
-                    'side': 'BUY',
-                    'quantity': position_size,
-                    'price': signal.price,
-                    'volume': position_size * signal.price,
-                    'strategy': strategy.name,
-                    'pnl': 0  # Will be updated when position is closed
-                })
+                with self._state_lock:
+                    # Record position
+                    self.positions[instrument] = {
+                        'side': 'BUY',
+                        'quantity': position_size,
+                        'entry_price': signal.price,
+                        'strategy': strategy.name,
+                        'timestamp': time.time()
+                    }
+                    
+                    # Record trade in history
+                    self._record_trade({
+                        'timestamp': datetime.now(),
+                        'instrument': instrument,
+                        'side': 'BUY',
+                        'quantity': position_size,
+                        'price': signal.price,
+                        'volume': position_size * signal.price,
+                        'strategy': strategy.name,
+                        'pnl': 0  # Will be updated when position is closed
+                    })
                 
                 self.trade_logger.position_opened(instrument, "BUY", position_size, signal.price)
                 logger.info(f"Opened BUY position: {position_size} {instrument} @ ${signal.price} using {strategy.name}")
@@ -310,31 +379,32 @@ class TradingBot:
                 else:
                     pnl = (entry_price - exit_price) * quantity
                 
-                # Update performance metrics
-                self.total_trades += 1
-                self.total_pnl += pnl
-                
-                if pnl > 0:
-                    self.winning_trades += 1
+                with self._state_lock:
+                    # Update performance metrics
+                    self.total_trades += 1
+                    self.total_pnl += pnl
+                    
+                    if pnl > 0:
+                        self.winning_trades += 1
+                    
+                    # Remove position
+                    del self.positions[instrument]
+                    
+                    # Record trade in history
+                    self._record_trade({
+                        'timestamp': datetime.now(),
+                        'instrument': instrument,
+                        'side': 'SELL',
+                        'quantity': quantity,
+                        'price': exit_price,
+                        'volume': quantity * exit_price,
+                        'strategy': strategy.name,
+                        'pnl': pnl
+                    })
                 
                 # Update strategy performance
                 strategy.update_performance(pnl, pnl > 0)
                 
-                # Record trade in history
-                self.trading_history.append({
-                    'timestamp': datetime.now(),
-                    'instrument': instrument,
-                    'side': 'SELL',
-                    'quantity': quantity,
-                    'price': exit_price,
-                    'volume': quantity * exit_price,
-                    'strategy': strategy.name,
-                    'pnl': pnl
-                })
-                
-                # Remove position
-                del self.positions[instrument]
-                
                 self.trade_logger.position_closed(instrument, "SELL", quantity, exit_price, pnl)
                 logger.info(f"Closed position: {instrument} @ ${exit_price} | PnL: ${pnl:.2f}")
                 
@@ -348,25 +418,31 @@ class TradingBot:
     
     def get_status(self) -> Dict:
         """Get bot status and performance metrics"""
-        win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
-        
-        return {
-            'running': self.running,
-            'total_trades': self.total_trades,
-            'winning_trades': self.winning_trades,
-            'win_rate': win_rate,
-            'total_pnl': self.total_pnl,
-            'open_positions': len(self.positions),
-            'active_strategies': [s.name for s in self.active_strategies],
-            'last_update': datetime.now().isoformat()
-        }
+        with self._state_lock:
+            win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
+            
+            return {
+                'running': self.running,
+                'total_trades': self.total_trades,
+                'winning_trades': self.winning_trades,
+                'win_rate': win_rate,
+                'total_pnl': self.total_pnl,
+                'open_positions': len(self.positions),
+                'active_strategies': [s.name for s in self.active_strategies],
+                'last_update': datetime.now().isoformat()
+            }
     
     def get_positions(self) -> Dict:
         """Get current positions"""
         positions_with_unrealized_pnl = {}
         
-        for instrument, position in self.positions.items():
-            current_price = self.market_data.get(instrument).close if instrument in self.market_data else 0
+        # Position records are replaced, never modified, so copying the
+        # mapping under the lock is enough for a consistent read
+        with self._state_lock:
+            positions = tuple(self.positions.items())
+        
+        for instrument, position in positions:
+            current_price = self.market_data_prices.get(instrument, 0)
             
             if current_price > 0:
                 entry_price = position['entry_price']
@@ -418,7 +494,21 @@ class TradingBot:
             logger.info(f"Updated config for strategy: {strategy_name}")
 
     def get_account_balance(self):
-        """Get account balance - proper method for API routes"""
+        """
+        Get account balance - proper method for API routes
+        
+        Concurrent callers inside BALANCE_TTL share one exchange round trip
+        instead of each parking a web worker on it. Trading decisions read the
+        balance from the API directly and never see this copy.
+        """
+        with self._balance_lock:
+            cached = self._balance_cache
+            if cached is None or time.monotonic() - cached[0] >= BALANCE_TTL:
+                cached = self._balance_cache = (time.monotonic(), self._fetch_account_balance())
+        return dict(cached[1])
+    
+    def _fetch_account_balance(self):
+        """Read the account balance from the exchange, falling back to demo figures"""
         try:
             # Get balance from Crypto.com API
             balance_data = self.api.get_balance()
@@ -482,9 +572,12 @@ class TradingBot:
                 })
             
             # Add crypto holdings from positions
-            for instrument, position in self.positions.items():
+            with self._state_lock:
+                positions = tuple(self.positions.items())
+            
+            for instrument, position in positions:
                 asset = instrument.split('USD')[0]  # Extract BTC from BTCUSD-PERP
-                current_price = self.market_data.get(instrument).close if instrument in self.market_data else 0
+                current_price = self.market_data_prices.get(instrument, 0)
                 quantity = position['quantity']
                 value = quantity * current_price
                 
@@ -524,100 +617,83 @@ class TradingBot:
     def get_all_market_data(self):
         """Get market data for all supported trading pairs"""
         try:
-            pairs = [
-                'BTCUSD-PERP', 'ETHUSD-PERP', 'ADAUSD-PERP', 'SOLUSD-PERP',
-                'DOTUSD-PERP', 'LINKUSD-PERP', 'AVAXUSD-PERP', 'MATICUSD-PERP'
-            ]
-            
-            market_data = {}
-            for pair in pairs:
-                try:
-                    # Get real data from API
-                    ticker_data = self.api.get_ticker(pair)
-                    
-                    if ticker_data.get("code") == 0 and ticker_data.get("result", {}).get("data"):
-                        ticker = ticker_data["result"]["data"][0]
-                        market_data[pair] = {
-                            'price': float(ticker.get('a', 0)),  # Ask price
-                            'change': float(ticker.get('c', 0)),  # 24h change
-                            'volume': float(ticker.get('v', 0))   # Volume
-                        }
-                    else:
-                        # Use stored data if available
-                        if pair in self.market_data:
-                            stored = self.market_data[pair]
-                            market_data[pair] = {
-                                'price': stored.close,
-                                'change': 0.0,  # Would need historical data
-                                'volume': stored.volume
-                            }
-                        else:
-                            # Fallback demo data
-                            demo_prices = {
-                                'BTCUSD-PERP': {'price': 100000, 'change': 2.5, 'volume': 1234567},
-                                'ETHUSD-PERP': {'price': 2630, 'change': -1.2, 'volume': 987654},
-                                'ADAUSD-PERP': {'price': 0.45, 'change': 3.1, 'volume': 456789},
-                                'SOLUSD-PERP': {'price': 185.50, 'change': -0.8, 'volume': 234567},
-                                'DOTUSD-PERP': {'price': 7.25, 'change': 1.5, 'volume': 123456},
-                                'LINKUSD-PERP': {'price': 15.80, 'change': -2.1, 'volume': 789012},
-                                'AVAXUSD-PERP': {'price': 42.30, 'change': 4.2, 'volume': 345678},
-                                'MATICUSD-PERP': {'price': 0.85, 'change': 0.7, 'volume': 567890}
-                            }
-                            market_data[pair] = demo_prices.get(pair, {'price': 0, 'change': 0, 'volume': 0})
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to get data for {pair}: {e}")
-                    # Fallback to demo data
-                    demo_prices = {
-                        'BTCUSD-PERP': {'price': 100000, 'change': 2.5, 'volume': 1234567},
-                        'ETHUSD-PERP': {'price': 2630, 'change': -1.2, 'volume': 987654},
-                        'ADAUSD-PERP': {'price': 0.45, 'change': 3.1, 'volume': 456789},
-                        'SOLUSD-PERP': {'price': 185.50, 'change': -0.8, 'volume': 234567},
-                        'DOTUSD-PERP': {'price': 7.25, 'change': 1.5, 'volume': 123456},
-                        'LINKUSD-PERP': {'price': 15.80, 'change': -2.1, 'volume': 789012},
-                        'AVAXUSD-PERP': {'price': 42.30, 'change': 4.2, 'volume': 345678},
-                        'MATICUSD-PERP': {'price': 0.85, 'change': 0.7, 'volume': 567890}
-                    }
-                    market_data[pair] = demo_prices.get(pair, {'price': 0, 'change': 0, 'volume': 0})
-            
-            return market_data
+            # Tickers are independent requests; fetch them concurrently so the
+            # endpoint costs one exchange round trip instead of one per pair.
+            # The dashboard still asks while the bot is stopped, and then
+            # there is no pool, so they are fetched one by one
+            pool = self._market_data_pool
+            results = (pool.map if pool else map)(self._get_pair_market_data, MARKET_PAIRS)
+            return dict(zip(MARKET_PAIRS, results))
             
         except Exception as e:
             logger.error(f"Error getting all market data: {e}")
             # Return demo data as complete fallback
-            return {
-                'BTCUSD-PERP': {'price': 100000, 'change': 2.5, 'volume': 1234567},
-                'ETHUSD-PERP': {'price': 2630, 'change': -1.2, 'volume': 987654},
-                'ADAUSD-PERP': {'price': 0.45, 'change': 3.1, 'volume': 456789},
-                'SOLUSD-PERP': {'price': 185.50, 'change': -0.8, 'volume': 234567},
-                'DOTUSD-PERP': {'price': 7.25, 'change': 1.5, 'volume': 123456},
-                'LINKUSD-PERP': {'price': 15.80, 'change': -2.1, 'volume': 789012},
-                'AVAXUSD-PERP': {'price': 42.30, 'change': 4.2, 'volume': 345678},
-                'MATICUSD-PERP': {'price': 0.85, 'change': 0.7, 'volume': 567890}
-            }
+            return {pair: dict(DEMO_MARKET_PRICES[pair]) for pair in MARKET_PAIRS}
 
-    def get_performance_metrics(self):
-        """Get real performance metrics from the bot"""
+    def _get_pair_market_data(self, pair: str) -> Dict:
+        """Ticker summary for one pair, falling back to stored or demo data"""
         try:
-            # Calculate real metrics from trading history
-            metrics = {
-                'total_pnl': self.total_pnl,
-                'total_trades': self.total_trades,
-                'win_rate': 0,
-                'daily_volume': 0,
-                'open_positions': self.positions
-            }
+            # Get real data from API
+            ticker_data = self.api.get_ticker(pair)
             
-            # Calculate win rate
-            if self.total_trades > 0:
-                metrics['win_rate'] = (self.winning_trades / self.total_trades) * 100
+            if ticker_data.get("code") == 0 and ticker_data.get("result", {}).get("data"):
+                ticker = ticker_data["result"]["data"][0]
+                return {
+                    'price': float(ticker.get('a', 0)),  # Ask price
+                    'change': float(ticker.get('c', 0)),  # 24h change
+                    'volume': float(ticker.get('v', 0))   # Volume
+                }
             
-            # Calculate daily volume (last 24h)
-            if self.trading_history:
-                from datetime import datetime, timedelta
-                yesterday = datetime.now() - timedelta(days=1)
-                daily_trades = [t for t in self.trading_history if t.get('timestamp', datetime.min) > yesterday]
-                metrics['daily_volume'] = sum(trade.get('volume', 0) for trade in daily_trades)
+            # Use stored data if available
+            if pair in self.market_data:
+                stored = self.market_data[pair]
+                return {
+                    'price': stored.close,
+                    'change': 0.0,  # Would need historical data
+                    'volume': stored.volume
+                }
+                
+        except Exception as e:
+            logger.warning(f"Failed to get data for {pair}: {e}")
+        
+        # Fallback demo data
+        return dict(DEMO_MARKET_PRICES.get(pair, {'price': 0, 'change': 0, 'volume': 0}))
+
+    def get_snapshot(self) -> Dict:
+        """Performance metrics and account balance for a single status read"""
+        # The balance comes from the exchange, so it is read outside the state
+        # lock; the metrics are taken under it in one go
+        balance = self.get_account_balance()
+        performance = self.get_performance_metrics()
+        
+        return {'performance': performance, 'balance': balance}
+
+    def get_performance_metrics(self):
+        """Get real performance metrics from the bot"""
+        try:
+            # Counters, positions and history are read under one lock hold so
+            # they describe the same moment; positions are copied because
+            # callers serialize them after the lock is released
+            with self._state_lock:
+                # Calculate real metrics from trading history
+                metrics = {
+                    'total_pnl': self.total_pnl,
+                    'total_trades': self.total_trades,
+                    'win_rate': 0,
+                    'daily_volume': 0,
+                    'open_positions': dict(self.positions)
+                }
+                
+                # Calculate win rate
+                if self.total_trades > 0:
+                    metrics['win_rate'] = (self.winning_trades / self.total_trades) * 100
+                
+                # Calculate daily volume (last 24h)
+                if self.trading_history:
+                    from datetime import datetime, timedelta
+                    yesterday = datetime.now() - timedelta(days=1)
+                    daily_trades = [t for t in self.trading_history if t.get('timestamp', datetime.min) > yesterday]
+                    metrics['daily_volume'] = sum(trade.get('volume', 0) for trade in daily_trades)
                 
             return metrics
             
@@ -11,6 +11,8 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 
+from .rolling_stats import RollingReturns
+
 logger = logging.getLogger(__name__)
 
 class SignalType(Enum):
@@ -58,6 +60,7 @@ class BaseStrategy(ABC):
         self.name = name
         self.config = config or {}
         self.market_data = {}  # instrument_name -> List[MarketData]
+        self.rolling_stats = {}  # instrument_name -> RollingReturns over the same window
         self.positions = {}    # instrument_name -> position_info
         self.performance = StrategyPerformance()
         self.enabled = True
@@ -78,6 +81,11 @@ class BaseStrategy(ABC):
         
         self.market_data[instrument].append(data)
         
+        stats = self.rolling_stats.get(instrument)
+        if stats is None:
+            stats = self.rolling_stats[instrument] = RollingReturns(self.max_lookback)
+        stats.update(data.close)
+        
         # Keep only max_lookback data points to manage memory
         if len(self.market_data[instrument]) > self.max_lookback:
             self.market_data[instrument] = self.market_data[instrument][-self.max_lookback:]
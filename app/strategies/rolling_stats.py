@@ -0,0 +1,80 @@
+"""
+Rolling Price Statistics
+Fixed-window close prices with incrementally maintained return statistics.
+"""
+
+from collections import deque
+
+import numpy as np
+
+class RollingReturns:
+    """
+    Close prices over a fixed lookback window, with the sum and sum of squares
+    of their simple returns kept up to date as bars arrive
+
+    Volatility is O(1) per read. Path-dependent metrics (drawdown, RSI) read
+    the closes as a NumPy array instead of rebuilding a DataFrame.
+    """
+
+    def __init__(self, window: int):
+        """
+        Args:
+            window: Number of close prices to keep (returns window is one shorter)
+        """
+        self.window = window
+        self._closes = deque(maxlen=window)
+        self._returns = deque(maxlen=max(window - 1, 1))
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._closes)
+
+    def update(self, close: float):
+        """Append a new bar's close and roll the oldest out of the window"""
+        if self._closes:
+            previous = self._closes[-1]
+            ret = (close - previous) / previous if previous else 0.0
+
+            if len(self._returns) == self._returns.maxlen:
+                oldest = self._returns[0]
+                self._sum -= oldest
+                self._sum_sq -= oldest * oldest
+            self._returns.append(ret)
+            self._sum += ret
+            self._sum_sq += ret * ret
+
+        self._closes.append(close)
+
+        # Re-sum once per window so floating-point drift can't accumulate
+        self._updates += 1
+        if self._updates >= self.window:
+            self._updates = 0
+            self._sum = float(sum(self._returns))
+            self._sum_sq = float(sum(r * r for r in self._returns))
+
+    def volatility(self, periods_per_year: int = 252) -> float:
+        """Annualized population standard deviation of the returns in the window"""
+        count = len(self._returns)
+        if count == 0:
+            return 0.0
+
+        mean = self._sum / count
+        variance = max(self._sum_sq / count - mean * mean, 0.0)
+        return float(np.sqrt(variance * periods_per_year))
+
+    def prices(self) -> np.ndarray:
+        """Close prices in the window, oldest first"""
+        return np.fromiter(self._closes, dtype=np.float64, count=len(self._closes))
+
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough decline of the compounded returns, in percent (<= 0)"""
+        prices = self.prices()
+        if len(prices) < 2:
+            return 0.0
+
+        # Compounding simple returns reproduces the price path relative to the first close
+        cumulative = prices[1:] / prices[0]
+        running_max = np.maximum.accumulate(cumulative)
+        return float(np.min((cumulative - running_max) / running_max) * 100)
@@ -341,21 +341,18 @@ class RSIStrategy(BaseStrategy):
     def get_risk_metrics(self, instrument: str) -> Dict:
         """Calculate risk metrics for the strategy"""
         try:
-            df = self.get_dataframe(instrument)
-            if df.empty:
+            # Rolling window kept by update_market_data; no DataFrame rebuild per call
+            stats = self.rolling_stats.get(instrument)
+            if stats is None or len(stats) < self.min_data_points:
                 return {}
             
-            prices = df['close'].values
-            returns = np.diff(prices) / prices[:-1]
+            prices = stats.prices()
             
             # Calculate volatility
-            volatility = np.std(returns) * np.sqrt(252)  # Annualized
+            volatility = stats.volatility()  # Annualized
             
             # Calculate maximum drawdown
-            cumulative = np.cumprod(1 + returns)
-            running_max = np.maximum.accumulate(cumulative)
-            drawdown = (cumulative - running_max) / running_max
-            max_drawdown = np.min(drawdown) * 100
+            max_drawdown = stats.max_drawdown()
             
             # Calculate current RSI level for risk assessment
             rsi_values = self.calculate_rsi(prices)
@@ -13,6 +13,10 @@ from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 @dataclass
 class APIConfig:
     """API configuration"""
@@ -63,6 +67,7 @@ class Config:
     def __init__(self, config_file: str = None):
         self.config_file = config_file or "config/config.yaml"
         self.config_data = {}
+        self.version = 0  # bumped by save_config(); lets readers cache derived views
         
         # Initialize with defaults
         self.api = APIConfig()
@@ -130,7 +135,7 @@ class Config:
         try:
             with open(config_path, 'r') as f:
                 if config_path.suffix.lower() == '.yaml' or config_path.suffix.lower() == '.yml':
-                    self.config_data = yaml.safe_load(f)
+                    self.config_data = yaml.load(f, Loader=YAML_LOADER)
                 elif config_path.suffix.lower() == '.json':
                     self.config_data = json.load(f)
                 else:
@@ -222,7 +227,7 @@ class Config:
         
         try:
             with open(config_path, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False, indent=2)
+                yaml.dump(default_config, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
             logger.info(f"Default configuration created at {self.config_file}")
         except Exception as e:
             logger.error(f"Error creating default config: {e}")
@@ -243,6 +248,7 @@ class Config:
     def save_config(self):
         """Save current configuration to file"""
         config_path = Path(self.config_file)
+        self.version += 1
         
         # Update config_data with current objects
         self.config_data.update({
@@ -256,7 +262,7 @@ class Config:
         try:
             with open(config_path, 'w') as f:
                 if config_path.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.dump(self.config_data, f, default_flow_style=False, indent=2)
+                    yaml.dump(self.config_data, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
                 elif config_path.suffix.lower() == '.json':
                     json.dump(self.config_data, f, indent=2)
             
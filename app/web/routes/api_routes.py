@@ -3,14 +3,229 @@ Complete REST API Routes
 Handles all REST API endpoints for the trading bot web interface.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from werkzeug.exceptions import BadRequest, HTTPException
+import orjson
 import logging
 import time
-from typing import Optional
-import traceback
+from typing import Optional, Union
+import threading
+import zlib
+from operator import attrgetter
+from datetime import datetime, timedelta
+from functools import wraps
+from decimal import Decimal
+
+import msgspec
+import numpy as np
+from cachetools import TTLCache
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; only /api/system/stats needs it
+    psutil = None
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is accepted by every browser
+    brotli = None
+
+from ...api.crypto_com_api import OrderRequest, OrderSide, OrderType
 
 logger = logging.getLogger(__name__)
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+STREAM_BATCH_ROWS = 256  # rows per chunk written by ostream()
+COMPRESS_MIN_SIZE = 512  # smaller JSON bodies aren't worth a compressor pass
+
+# MarketData fields served per instrument, fetched in one C-level call
+QUOTE_FIELDS = attrgetter('close', 'volume', 'timestamp', 'bid', 'ask')
+
+# Shared generator for the sandbox demo data
+_rng = np.random.default_rng()
+TRADE_SIDES = np.array(['BUY', 'SELL'])
+
+# Demo candle spacing per timeframe; unknown timeframes fall back to 1h
+TIMEFRAME_STEP_MS = {'1m': 60_000, '1h': 3_600_000, '1d': 86_400_000}
+
+# /api/health is polled by probes; only the flags and timestamp change per call
+_HEALTH_TEMPLATE = b'{"status":"healthy","bot_running":%s,"api_connected":%s,"timestamp":%.3f}'
+
+# Fixed responses (no bot attached, constant replies, error handlers), encoded once at import
+_BOT_UNAVAILABLE = orjson.dumps({'status': 'error', 'message': 'Bot not available'})
+_STATUS_NOT_INIT = orjson.dumps({
+    'status': 'error',
+    'running': False,
+    'message': 'Bot not initialized',
+    'totalPnl': 0,
+    'totalTrades': 0,
+    'winRate': 0,
+    'openPositions': 0,
+    'dailyVolume': 0,
+    'accountBalance': 0,
+    'availableBalance': 0
+})
+_NOT_FOUND = orjson.dumps({'status': 'error', 'message': 'Endpoint not found', 'code': 404})
+_INTERNAL_ERROR = orjson.dumps({'status': 'error', 'message': 'Internal server error', 'code': 500})
+_BAD_REQUEST = orjson.dumps({'status': 'error', 'message': 'Bad request', 'code': 400})
+_ALREADY_RUNNING = orjson.dumps({'status': 'error', 'message': 'Bot already running'})
+_NOT_RUNNING = orjson.dumps({'status': 'error', 'message': 'Bot not running'})
+_STRATEGY_NAME_REQUIRED = orjson.dumps({'status': 'error', 'message': 'Strategy name required'})
+_ORDER_FIELDS_REQUIRED = orjson.dumps({'status': 'error', 'message': 'Missing required fields: symbol, side, quantity'})
+_NO_SIGNAL_HISTORY = orjson.dumps({'status': 'success', 'signals': [], 'message': 'Strategy does not support signal history'})
+_NO_OPTIMIZATION = orjson.dumps({'status': 'error', 'message': 'Strategy does not support optimization'})
+_PSUTIL_MISSING = orjson.dumps({'status': 'error', 'message': 'psutil is not installed'})
+_BOT_STARTED = orjson.dumps({'status': 'success', 'message': 'Bot started'})
+_BOT_STOPPED = orjson.dumps({'status': 'success', 'message': 'Bot stopped'})
+_ORDER_CANCELLED = orjson.dumps({'status': 'success', 'message': 'Order cancelled successfully'})
+_CONFIG_UPDATED = orjson.dumps({'status': 'success', 'message': 'Configuration updated successfully'})
+_CONNECTION_OK_SANDBOX = orjson.dumps({'status': 'success', 'message': 'Connection test successful (sandbox mode)'})
+_CONNECTION_OK = orjson.dumps({'status': 'success', 'message': 'Connection test successful'})
+
+# Demo notifications are fixed apart from their timestamps (1h, 2h and 3h ago);
+# encode once and splice the times in per request. Literal '%' is escaped for
+# the % formatting.
+_NOTIFICATIONS_TEMPLATE = orjson.dumps({
+    'status': 'success',
+    'notifications': [
+        {
+            'id': 1,
+            'type': 'trade',
+            'message': 'BUY order executed: 0.1 BTCUSD-PERP @ $100,000',
+            'timestamp': '@ts@',
+            'severity': 'info'
+        },
+        {
+            'id': 2,
+            'type': 'pnl',
+            'message': 'Daily PnL target reached: +2.5%',
+            'timestamp': '@ts@',
+            'severity': 'success'
+        },
+        {
+            'id': 3,
+            'type': 'risk',
+            'message': 'Position size approaching limit',
+            'timestamp': '@ts@',
+            'severity': 'warning'
+        }
+    ]
+}).replace(b'%', b'%%').replace(b'"@ts@"', b'%d')
+
+def _int_arg(name: str, default: int) -> int:
+    """Integer query parameter, or the default when missing or malformed"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+def _json_body() -> dict:
+    """
+    Request body parsed with orjson; an empty body reads as {}
+    
+    The body is read with cache=False: it is parsed exactly once, so Flask
+    doesn't need to keep a second copy on the request. Malformed JSON or a
+    non-object body is a 400, not a handler crash.
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise BadRequest()
+    if not isinstance(data, dict):
+        raise BadRequest()
+    return data
+
+def _json_default(obj):
+    """Serialize types orjson doesn't handle natively (pandas timestamps, numpy scalars, Decimal)"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class OrderPayload(msgspec.Struct):
+    """Body of POST /api/orders"""
+    symbol: str = ''
+    side: str = ''
+    type: str = 'market'
+    quantity: float = 0.0
+    # The dashboard sends "" for a market order, so strings are kept as-is
+    # here and converted in the handler
+    price: Union[float, str, None] = None
+
+class ConfigPayload(msgspec.Struct):
+    """Body of POST /api/config; omitted fields are left unchanged"""
+    maxPositionSize: Optional[float] = None
+    stopLoss: Optional[float] = None
+    takeProfit: Optional[float] = None
+    tradingMode: Optional[str] = None
+
+# Decoders are built once; strict=False accepts numbers sent as strings
+_order_decoder = msgspec.json.Decoder(OrderPayload, strict=False)
+_config_decoder = msgspec.json.Decoder(ConfigPayload, strict=False)
+
+class TTLMemo:
+    """
+    TTL cache whose misses are computed once, even with concurrent callers
+
+    With stale_ttl set, the last good value is kept that much longer and
+    served if a refresh raises, so a flaky exchange call doesn't turn into
+    a 500 on every dashboard poll.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float = 0.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._stale = TTLCache(maxsize=maxsize, ttl=stale_ttl) if stale_ttl else None
+        self._lock = threading.Lock()
+    
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+            try:
+                value = compute()
+            except Exception:
+                if self._stale is None or key not in self._stale:
+                    raise
+                logger.warning("Refreshing %r failed, serving the last good value", key, exc_info=True)
+                return self._stale[key]
+            self._cache[key] = value
+            if self._stale is not None:
+                self._stale[key] = value
+            return value
+    
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            if self._stale is not None:
+                self._stale.clear()
+
+def build_status(bot) -> dict:
+    """Bot status with real performance metrics, as served by /api/status"""
+    snapshot = bot.get_snapshot()
+    performance = snapshot['performance']
+    balance = snapshot['balance']
+    
+    return {
+        'status': 'success',
+        'running': bot.running,
+        'totalPnl': performance.get('total_pnl', 0),
+        'totalTrades': performance.get('total_trades', 0),
+        'winRate': performance.get('win_rate', 0),
+        'openPositions': len(performance.get('open_positions', {})),
+        'dailyVolume': performance.get('daily_volume', 0),
+        'accountBalance': balance.get('total_balance', 0),
+        'availableBalance': balance.get('available_balance', 0)
+    }
+
 def create_api_routes(app: Flask, bot=None):
     """
     Create comprehensive API routes for the Flask application
@@ -18,45 +233,132 @@ def create_api_routes(app: Flask, bot=None):
     Args:
         app: Flask application instance
         bot: Trading bot instance
+    
+    Returns:
+        Callable that drops the cached status/performance/risk readings,
+        for other entry points that start or stop the bot
     """
     
+    def ojsonify(payload, status: int = 200):
+        """orjson-backed replacement for flask.jsonify"""
+        return app.response_class(
+            orjson.dumps(payload, default=_json_default, option=ORJSON_OPTIONS),
+            status=status,
+            mimetype='application/json'
+        )
+    
+    def encode_rows(rows):
+        """Encode rows as the comma-separated body of a JSON array, STREAM_BATCH_ROWS at a time"""
+        return join_encoded(orjson.dumps(row, default=_json_default, option=ORJSON_OPTIONS) for row in rows)
+    
+    def join_encoded(encoded_rows):
+        """Join already-encoded rows into the body of a JSON array, STREAM_BATCH_ROWS at a time"""
+        separator, batch = b'', []
+        for encoded in encoded_rows:
+            batch.append(encoded)
+            if len(batch) == STREAM_BATCH_ROWS:
+                yield separator + b','.join(batch)
+                separator, batch = b',', []
+        if batch:
+            yield separator + b','.join(batch)
+    
+    def ostream(head: dict, key: str, rows):
+        """
+        Stream {**head, key: [rows]} as JSON without serializing the whole array up front
+        
+        Rows are encoded as they are produced and written in batches of
+        STREAM_BATCH_ROWS, so large lists never exist as one bytes buffer.
+        """
+        def generate():
+            prefix = orjson.dumps(head, default=_json_default, option=ORJSON_OPTIONS)[:-1]
+            yield prefix + (b',"' if head else b'"') + key.encode() + b'":['
+            yield from encode_rows(rows)
+            yield b']}'
+        
+        return app.response_class(generate(), mimetype='application/json')
+    
+    def raw_json(body: bytes, status: int = 200):
+        """Wrap an already-encoded JSON body; responses are mutable, so one is built per request"""
+        return app.response_class(body, status=status, mimetype='application/json')
+    
+    def requires_bot(handler):
+        """Answer 'Bot not available' without running the handler when no bot is attached"""
+        if bot:
+            return handler
+        
+        @wraps(handler)
+        def unavailable(*args, **kwargs):
+            return raw_json(_BOT_UNAVAILABLE)
+        return unavailable
+    
+    def api_endpoint(handler):
+        """Turn any exception escaping a route handler into a logged JSON 500"""
+        @wraps(handler)
+        def wrapper(*args, **kwargs):
+            try:
+                return handler(*args, **kwargs)
+            except HTTPException:
+                # Deliberate client errors (bad request bodies) go to the error handlers
+                raise
+            except Exception as e:
+                logger.exception("Error in %s: %s", handler.__name__, e)
+                return ojsonify({'status': 'error', 'message': str(e)}, 500)
+        return wrapper
+    
+    # Dashboards poll these every second or two, often from several tabs;
+    # short TTLs collapse the pollers onto one bot/exchange computation
+    status_cache = TTLMemo(maxsize=1, ttl=1.0, stale_ttl=30.0)
+    market_cache = TTLMemo(maxsize=1, ttl=1.0, stale_ttl=30.0)
+    instrument_cache = TTLMemo(maxsize=128, ttl=0.5, stale_ttl=30.0)
+    performance_cache = TTLMemo(maxsize=1, ttl=2.0)
+    holdings_cache = TTLMemo(maxsize=1, ttl=2.0, stale_ttl=30.0)
+    risk_cache = TTLMemo(maxsize=1, ttl=0.5)
+    system_cache = TTLMemo(maxsize=1, ttl=1.0)
+    
+    def clear_status_caches():
+        """Forget cached readings that depend on whether the bot is running"""
+        status_cache.clear()
+        performance_cache.clear()
+        risk_cache.clear()
+    
+    def market_snapshot():
+        """All-pairs market data, with the /api/market-data/all body encoded once alongside it"""
+        data = bot.get_all_market_data()
+        return data, orjson.dumps({'status': 'success', 'data': data}, default=_json_default, option=ORJSON_OPTIONS)
+    
+    # cpu_percent(interval=None) reports usage since the previous call; prime it
+    # here so the first stats request gets a real figure without sleeping
+    if psutil is not None:
+        psutil.cpu_percent(interval=None)
+        
+        # Our own process handle; its start time never changes
+        process = psutil.Process()
+        process_started = process.create_time()
+    
+    # Serialized /api/config response and the redacted config for
+    # /api/backup/export, each tagged with the bot.config.version it was
+    # built from; any save_config() makes them stale
+    config_body = (None, b'')
+    export_config = (None, None)
+    config_lock = threading.Lock()
+    
+    @app.route('/api/ping', methods=['GET'])
+    def ping():
+        """No-op endpoint that keeps the dashboard's HTTP connection warm"""
+        return '', 204
+    
     @app.route('/api/status', methods=['GET'])
     def get_status():
         """Get bot status with real performance metrics"""
         try:
             if not bot:
-                return jsonify({
-                    'status': 'error',
-                    'running': False,
-                    'message': 'Bot not initialized',
-                    'totalPnl': 0,
-                    'totalTrades': 0,
-                    'winRate': 0,
-                    'openPositions': 0,
-                    'dailyVolume': 0,
-                    'accountBalance': 0,
-                    'availableBalance': 0
-                })
+                return raw_json(_STATUS_NOT_INIT)
             
-            # Get real performance data from bot
-            performance = bot.get_performance_metrics()
-            balance = bot.get_account_balance()
-            
-            return jsonify({
-                'status': 'success',
-                'running': bot.running,
-                'totalPnl': performance.get('total_pnl', 0),
-                'totalTrades': performance.get('total_trades', 0),
-                'winRate': performance.get('win_rate', 0),
-                'openPositions': len(performance.get('open_positions', {})),
-                'dailyVolume': performance.get('daily_volume', 0),
-                'accountBalance': balance.get('total_balance', 0),
-                'availableBalance': balance.get('available_balance', 0)
-            })
+            return ojsonify(status_cache.get('status', lambda: build_status(bot)))
             
         except Exception as e:
-            logger.error(f"Error getting status: {e}")
-            return jsonify({
+            logger.error("Error getting status: %s", e)
+            return ojsonify({
                 'status': 'error',
                 'running': False,
                 'message': f'Status error: {str(e)}',
@@ -67,229 +369,211 @@ def create_api_routes(app: Flask, bot=None):
                 'dailyVolume': 0,
                 'accountBalance': 0,
                 'availableBalance': 0
-            }), 500
+            }, 500)
+
+    @app.route('/api/dashboard', methods=['GET'])
+    @api_endpoint
+    @requires_bot
+    def get_dashboard():
+        """Status, market data and positions for the dashboard's first paint in one request"""
+        # Shares the per-endpoint caches, so concurrent pollers of the
+        # individual endpoints and this one still hit the bot once
+        return ojsonify({
+            'status': 'success',
+            'bot_status': status_cache.get('status', lambda: build_status(bot)),
+            'market_data': market_cache.get('all', market_snapshot)[0],
+            'positions': bot.get_positions()
+        })
+
+    @app.route('/api/dashboard/boot.js', methods=['GET'])
+    def get_dashboard_boot():
+        """Initial dashboard state as a script, so the dashboard page itself stays static and cacheable"""
+        boot = None
+        if bot:
+            try:
+                boot = {
+                    'status': status_cache.get('status', lambda: build_status(bot)),
+                    'positions': bot.get_positions()
+                }
+            except Exception as e:
+                # The dashboard falls back to /api/dashboard
+                logger.error("Error building dashboard bootstrap: %s", e)
+        
+        # Escape '</' so string values can't close the <script> element
+        payload = orjson.dumps(boot, default=_json_default, option=ORJSON_OPTIONS).replace(b'</', b'<\\/')
+        response = app.response_class(b'window.__BOOT__=' + payload + b';', mimetype='text/javascript')
+        response.headers['Cache-Control'] = 'no-store'
+        return response
 
     @app.route('/api/start', methods=['POST'])
+    @api_endpoint
     def start_bot():
         """Start the trading bot"""
-        try:
-            if bot and not bot.running:
-                bot.start()
-                return jsonify({'status': 'success', 'message': 'Bot started'})
-            elif bot and bot.running:
-                return jsonify({'status': 'error', 'message': 'Bot already running'})
-            else:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-        except Exception as e:
-            logger.error(f"Error starting bot: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        if bot and not bot.running:
+            bot.start()
+            clear_status_caches()
+            return raw_json(_BOT_STARTED)
+        elif bot and bot.running:
+            return raw_json(_ALREADY_RUNNING)
+        else:
+            return raw_json(_BOT_UNAVAILABLE)
     
     @app.route('/api/stop', methods=['POST'])
+    @api_endpoint
     def stop_bot():
         """Stop the trading bot"""
-        try:
-            if bot and bot.running:
-                bot.stop()
-                return jsonify({'status': 'success', 'message': 'Bot stopped'})
-            elif bot and not bot.running:
-                return jsonify({'status': 'error', 'message': 'Bot not running'})
-            else:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-        except Exception as e:
-            logger.error(f"Error stopping bot: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        if bot and bot.running:
+            bot.stop()
+            clear_status_caches()
+            return raw_json(_BOT_STOPPED)
+        elif bot and not bot.running:
+            return raw_json(_NOT_RUNNING)
+        else:
+            return raw_json(_BOT_UNAVAILABLE)
 
     @app.route('/api/market-data/all', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_all_market_data():
         """Get market data for all trading pairs"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            market_data = bot.get_all_market_data()
-            return jsonify({
-                'status': 'success',
-                'data': market_data
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting market data: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        return raw_json(market_cache.get('all', market_snapshot)[1])
 
     @app.route('/api/market-data/<instrument>', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_market_data(instrument):
         """Get market data for specific instrument"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            if instrument in bot.market_data:
-                data = bot.market_data[instrument]
-                return jsonify({
+        def instrument_body():
+            if (data := bot.market_data.get(instrument)) is not None:
+                price, volume, timestamp, bid, ask = QUOTE_FIELDS(data)
+                payload = {
                     'status': 'success',
                     'data': {
                         'instrument': instrument,
-                        'price': data.close,
-                        'volume': data.volume,
-                        'timestamp': data.timestamp,
-                        'bid': data.bid,
-                        'ask': data.ask
+                        'price': price,
+                        'volume': volume,
+                        'timestamp': timestamp,
+                        'bid': bid,
+                        'ask': ask
                     }
-                })
+                }
             else:
-                return jsonify({'status': 'error', 'message': f'No data for {instrument}'})
-                
-        except Exception as e:
-            logger.error(f"Error getting market data for {instrument}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                payload = {'status': 'error', 'message': f'No data for {instrument}'}
+            return orjson.dumps(payload, default=_json_default, option=ORJSON_OPTIONS)
+        
+        # Cached encoded, so pollers inside the TTL skip the encode too
+        return raw_json(instrument_cache.get(instrument, instrument_body))
 
     @app.route('/api/account/balance', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_account_balance():
         """Get account balance"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            balance = bot.get_account_balance()
-            return jsonify({
-                'status': 'success',
-                'balance': balance
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting account balance: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        balance = bot.get_account_balance()
+        return ojsonify({
+            'status': 'success',
+            'balance': balance
+        })
 
     @app.route('/api/account/holdings', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_account_holdings():
         """Get account holdings for portfolio display"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            holdings = bot.get_account_holdings()
-            return jsonify({
-                'status': 'success',
-                'holdings': holdings
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting account holdings: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        holdings = holdings_cache.get('holdings', bot.get_account_holdings)
+        return ojsonify({
+            'status': 'success',
+            'holdings': holdings
+        })
 
     @app.route('/api/positions', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_positions():
         """Get current positions"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            positions = bot.get_positions()
-            return jsonify({
-                'status': 'success',
-                'positions': positions
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting positions: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        positions = bot.get_positions()
+        return ojsonify({
+            'status': 'success',
+            'positions': positions
+        })
 
     @app.route('/api/strategies', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_strategies():
         """Get all trading strategies"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            strategies = bot.get_strategies_info()
-            return jsonify({
-                'status': 'success',
-                'strategies': strategies
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting strategies: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        strategies = bot.get_strategies_info()
+        return ojsonify({
+            'status': 'success',
+            'strategies': strategies
+        })
 
     @app.route('/api/strategies/enable', methods=['POST'])
+    @api_endpoint
+    @requires_bot
     def enable_strategy():
         """Enable a trading strategy"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            data = request.get_json()
-            strategy_id = data.get('strategy_id')
-            strategy_name = data.get('strategy_name')
-            
-            # For now, use strategy_name (in real app, map ID to name)
-            if strategy_name:
-                bot.enable_strategy(strategy_name)
-                return jsonify({'status': 'success', 'message': f'Enabled {strategy_name}'})
-            else:
-                return jsonify({'status': 'error', 'message': 'Strategy name required'})
-                
-        except Exception as e:
-            logger.error(f"Error enabling strategy: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        data = _json_body()
+        strategy_id = data.get('strategy_id')
+        strategy_name = data.get('strategy_name')
+        
+        # For now, use strategy_name (in real app, map ID to name)
+        if strategy_name:
+            bot.enable_strategy(strategy_name)
+            return ojsonify({'status': 'success', 'message': f'Enabled {strategy_name}'})
+        else:
+            return raw_json(_STRATEGY_NAME_REQUIRED)
 
     @app.route('/api/strategies/disable', methods=['POST'])
+    @api_endpoint
+    @requires_bot
     def disable_strategy():
         """Disable a trading strategy"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            data = request.get_json()
-            strategy_id = data.get('strategy_id')
-            strategy_name = data.get('strategy_name')
-            
-            # For now, use strategy_name (in real app, map ID to name)
-            if strategy_name:
-                bot.disable_strategy(strategy_name)
-                return jsonify({'status': 'success', 'message': f'Disabled {strategy_name}'})
-            else:
-                return jsonify({'status': 'error', 'message': 'Strategy name required'})
-                
-        except Exception as e:
-            logger.error(f"Error disabling strategy: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        data = _json_body()
+        strategy_id = data.get('strategy_id')
+        strategy_name = data.get('strategy_name')
+        
+        # For now, use strategy_name (in real app, map ID to name)
+        if strategy_name:
+            bot.disable_strategy(strategy_name)
+            return ojsonify({'status': 'success', 'message': f'Disabled {strategy_name}'})
+        else:
+            return raw_json(_STRATEGY_NAME_REQUIRED)
 
     @app.route('/api/orders', methods=['POST'])
+    @api_endpoint
+    @requires_bot
     def place_order():
         """Place a trading order"""
         try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            data = request.get_json()
-            
-            # Extract order parameters
-            symbol = data.get('symbol')
-            side = data.get('side')
-            order_type = data.get('type', 'market')
-            quantity = float(data.get('quantity', 0))
-            price = float(data.get('price', 0)) if data.get('price') else None
+            # Parse, type-check and coerce the order parameters in one pass
+            order = _order_decoder.decode(request.get_data(cache=False))
+            symbol = order.symbol
+            side = order.side
+            order_type = order.type
+            quantity = order.quantity
+            price = order.price
+            if isinstance(price, str):
+                try:
+                    price = float(price) if price.strip() else None
+                except ValueError:
+                    return ojsonify({'status': 'error', 'message': f'Invalid order: invalid price {price!r}'}, 400)
+            price = price or None
             
             # Validate required fields
             if not symbol or not side or quantity <= 0:
-                return jsonify({
-                    'status': 'error', 
-                    'message': 'Missing required fields: symbol, side, quantity'
-                })
+                return raw_json(_ORDER_FIELDS_REQUIRED)
             
             # For demo mode, simulate order placement
             if bot.config.api.sandbox:
-                logger.info(f"DEMO ORDER: {side} {quantity} {symbol} @ {price or 'market'}")
-                return jsonify({
+                logger.info("DEMO ORDER: %s %s %s @ %s", side, quantity, symbol, price or 'market')
+                return ojsonify({
                     'status': 'success',
                     'message': f'Demo order placed: {side} {quantity} {symbol}',
                     'order_id': f'demo_{int(time.time())}'
                 })
             else:
                 # Real order placement would go here
-                from ..api.crypto_com_api import OrderRequest, OrderSide, OrderType
-                
                 order_side = OrderSide.BUY if side.upper() == 'BUY' else OrderSide.SELL
                 order_type_enum = OrderType.LIMIT if order_type == 'limit' else OrderType.MARKET
                 
@@ -304,644 +588,544 @@ def create_api_routes(app: Flask, bot=None):
                 result = bot.api.create_order(order_request)
                 
                 if result.get('code') == 0:
-                    return jsonify({
+                    return ojsonify({
                         'status': 'success',
                         'message': 'Order placed successfully',
                         'order_id': result.get('result', {}).get('order_id')
                     })
                 else:
-                    return jsonify({
+                    return ojsonify({
                         'status': 'error',
                         'message': result.get('message', 'Order placement failed')
                     })
             
-        except Exception as e:
-            logger.error(f"Error placing order: {e}")
-            logger.error(traceback.format_exc())
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        except msgspec.DecodeError as e:
+            return ojsonify({'status': 'error', 'message': f'Invalid order: {e}'}, 400)
 
     @app.route('/api/orders/<order_id>', methods=['DELETE'])
+    @api_endpoint
+    @requires_bot
     def cancel_order(order_id):
         """Cancel a trading order"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
+        if bot.config.api.sandbox:
+            return ojsonify({
+                'status': 'success',
+                'message': f'Demo order {order_id} cancelled'
+            })
+        else:
+            result = bot.api.cancel_order(order_id=order_id)
             
-            if bot.config.api.sandbox:
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Demo order {order_id} cancelled'
-                })
+            if result.get('code') == 0:
+                return raw_json(_ORDER_CANCELLED)
             else:
-                result = bot.api.cancel_order(order_id=order_id)
-                
-                if result.get('code') == 0:
-                    return jsonify({
-                        'status': 'success',
-                        'message': 'Order cancelled successfully'
-                    })
-                else:
-                    return jsonify({
-                        'status': 'error',
-                        'message': result.get('message', 'Order cancellation failed')
-                    })
-            
-        except Exception as e:
-            logger.error(f"Error cancelling order: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                return ojsonify({
+                    'status': 'error',
+                    'message': result.get('message', 'Order cancellation failed')
+                })
 
     @app.route('/api/config', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_config():
         """Get current bot configuration"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            config_dict = bot.config.to_dict()
-            
-            # Remove sensitive information
-            if 'api' in config_dict:
-                config_dict['api']['api_key'] = '***' if config_dict['api']['api_key'] else ''
-                config_dict['api']['secret_key'] = '***' if config_dict['api']['secret_key'] else ''
-            
-            return jsonify({
-                'status': 'success',
-                'config': config_dict
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting config: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        nonlocal config_body
+        with config_lock:
+            version = bot.config.version
+            if config_body[0] != version:
+                config_dict = bot.config.to_dict()
+                
+                # Remove sensitive information
+                if 'api' in config_dict:
+                    config_dict['api']['api_key'] = '***' if config_dict['api']['api_key'] else ''
+                    config_dict['api']['secret_key'] = '***' if config_dict['api']['secret_key'] else ''
+                
+                config_body = (version, orjson.dumps({
+                    'status': 'success',
+                    'config': config_dict
+                }, default=_json_default, option=ORJSON_OPTIONS))
+            body = config_body[1]
+        
+        return raw_json(body)
 
     @app.route('/api/config', methods=['POST'])
+    @api_endpoint
+    @requires_bot
     def update_config():
         """Update bot configuration"""
         try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            data = request.get_json()
+            data = _config_decoder.decode(request.get_data(cache=False))
             
             # Update configuration safely
-            if 'maxPositionSize' in data:
-                bot.config.risk.max_position_size = float(data['maxPositionSize'])
+            if data.maxPositionSize is not None:
+                bot.config.risk.max_position_size = data.maxPositionSize
             
-            if 'stopLoss' in data:
-                bot.config.risk.default_stop_loss = float(data['stopLoss'])
+            if data.stopLoss is not None:
+                bot.config.risk.default_stop_loss = data.stopLoss
             
-            if 'takeProfit' in data:
-                bot.config.risk.default_take_profit = float(data['takeProfit'])
+            if data.takeProfit is not None:
+                bot.config.risk.default_take_profit = data.takeProfit
             
-            if 'tradingMode' in data:
+            if data.tradingMode is not None:
                 # Update sandbox mode based on trading mode
-                bot.config.api.sandbox = data['tradingMode'] != 'live'
+                bot.config.api.sandbox = data.tradingMode != 'live'
             
-            # Save configuration
+            # Save configuration (also bumps bot.config.version)
             bot.config.save_config()
             
-            return jsonify({
-                'status': 'success',
-                'message': 'Configuration updated successfully'
-            })
+            return raw_json(_CONFIG_UPDATED)
             
-        except Exception as e:
-            logger.error(f"Error updating config: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        except msgspec.DecodeError as e:
+            return ojsonify({'status': 'error', 'message': f'Invalid configuration: {e}'}, 400)
 
     @app.route('/api/test-connection', methods=['POST'])
+    @api_endpoint
     def test_connection():
         """Test API connection"""
-        try:
-            data = request.get_json()
-            
-            # For demo purposes, always return success for sandbox
-            if data.get('exchange') == 'crypto_com':
-                if bot and bot.config.api.sandbox:
-                    return jsonify({
-                        'status': 'success',
-                        'message': 'Connection test successful (sandbox mode)'
-                    })
-                elif bot:
-                    # Test real connection
-                    try:
-                        result = bot.api.get_instruments()
-                        if result.get('code') == 0:
-                            return jsonify({
-                                'status': 'success',
-                                'message': 'Connection test successful'
-                            })
-                        else:
-                            return jsonify({
-                                'status': 'error',
-                                'message': f'API Error: {result.get("message", "Unknown error")}'
-                            })
-                    except Exception as api_error:
-                        return jsonify({
+        data = _json_body()
+        
+        # For demo purposes, always return success for sandbox
+        if data.get('exchange') == 'crypto_com':
+            if bot and bot.config.api.sandbox:
+                return raw_json(_CONNECTION_OK_SANDBOX)
+            elif bot:
+                # Test real connection
+                try:
+                    result = bot.api.get_instruments()
+                    if result.get('code') == 0:
+                        return raw_json(_CONNECTION_OK)
+                    else:
+                        return ojsonify({
                             'status': 'error',
-                            'message': f'Connection failed: {str(api_error)}'
+                            'message': f'API Error: {result.get("message", "Unknown error")}'
                         })
-                else:
-                    return jsonify({
+                except Exception as api_error:
+                    return ojsonify({
                         'status': 'error',
-                        'message': 'Bot not available'
+                        'message': f'Connection failed: {str(api_error)}'
                     })
             else:
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Exchange {data.get("exchange")} not supported yet'
-                })
-            
-        except Exception as e:
-            logger.error(f"Error testing connection: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                return raw_json(_BOT_UNAVAILABLE)
+        else:
+            return ojsonify({
+                'status': 'error',
+                'message': f'Exchange {data.get("exchange")} not supported yet'
+            })
 
     @app.route('/api/performance', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_performance():
         """Get detailed performance metrics"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
+        def detailed_performance():
             performance = bot.get_performance_metrics()
             
             # Add additional calculated metrics
             if performance.get('total_trades', 0) > 0:
                 performance['loss_rate'] = 100 - performance.get('win_rate', 0)
                 performance['avg_trade'] = performance.get('total_pnl', 0) / performance['total_trades']
-            
-            return jsonify({
-                'status': 'success',
-                'performance': performance
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting performance: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+            return performance
+        
+        return ojsonify({
+            'status': 'success',
+            'performance': performance_cache.get('performance', detailed_performance)
+        })
 
     @app.route('/api/history/trades', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_trade_history():
         """Get trading history"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            # Get recent trades from bot's trading history
-            trades = getattr(bot, 'trading_history', [])
-            
-            # Format trades for frontend
-            formatted_trades = []
-            for trade in trades[-50:]:  # Last 50 trades
-                formatted_trades.append({
-                    'id': trade.get('timestamp').strftime('%Y%m%d%H%M%S') if hasattr(trade.get('timestamp'), 'strftime') else str(int(time.time())),
-                    'timestamp': trade.get('timestamp').isoformat() if hasattr(trade.get('timestamp'), 'isoformat') else str(trade.get('timestamp')),
-                    'instrument': trade.get('instrument'),
-                    'side': trade.get('side'),
-                    'quantity': trade.get('quantity'),
-                    'price': trade.get('price'),
-                    'volume': trade.get('volume'),
-                    'pnl': trade.get('pnl', 0),
-                    'strategy': trade.get('strategy')
-                })
-            
-            return jsonify({
-                'status': 'success',
-                'trades': formatted_trades
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting trade history: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        # Get recent trades from bot's trading history
+        trades = getattr(bot, 'trading_history', [])
+        
+        # Format trades for frontend as they are streamed out; trades without a
+        # datetime stamp share one fallback id
+        fallback_id = str(int(time.time()))
+        
+        def format_trade(trade, ts):
+            return {
+                'id': ts.strftime('%Y%m%d%H%M%S') if isinstance(ts, datetime) else fallback_id,
+                'timestamp': ts,
+                'instrument': trade.get('instrument'),
+                'side': trade.get('side'),
+                'quantity': trade.get('quantity'),
+                'price': trade.get('price'),
+                'volume': trade.get('volume'),
+                'pnl': trade.get('pnl', 0),
+                'strategy': trade.get('strategy')
+            }
+        
+        formatted_trades = (format_trade(trade, trade.get('timestamp')) for trade in trades[-50:])  # Last 50 trades
+        
+        return ostream({'status': 'success'}, 'trades', formatted_trades)
 
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
         try:
-            status = {
-                'status': 'healthy',
-                'timestamp': time.time(),
-                'bot_running': bot.running if bot else False,
-                'api_connected': True if bot and bot.api else False
-            }
-            
-            return jsonify(status)
+            payload = _HEALTH_TEMPLATE % (
+                b'true' if bot and bot.running else b'false',
+                b'true' if bot and bot.api else b'false',
+                time.time()
+            )
+            return app.response_class(payload, mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Health check error: {e}")
-            return jsonify({
+            logger.error("Health check error: %s", e)
+            return ojsonify({
                 'status': 'unhealthy',
                 'error': str(e),
                 'timestamp': time.time()
-            }), 500
+            }, 500)
 
     @app.route('/api/orderbook/<instrument>', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_orderbook(instrument):
         """Get order book for specific instrument"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            # Get depth parameter
-            depth = request.args.get('depth', 10, type=int)
+        # Get depth parameter
+        depth = _int_arg('depth', 10)
+        
+        if bot.config.api.sandbox:
+            # Generate demo order book data
+            current_price = bot.market_data_prices.get(instrument) or 100000
+            
+            # Levels step 0.01% away from the current price on each side
+            level = np.arange(1, max(depth, 0) + 1)
+            offset = level * (current_price * 0.0001)
+            quantities = np.round(0.1 + (level - 1) * 0.05, 4).tolist()
+            ask_prices = np.round(current_price + offset, 2).tolist()
+            bid_prices = np.round(current_price - offset, 2).tolist()
+            
+            asks = [{'price': p, 'quantity': q} for p, q in zip(ask_prices, quantities)]
+            bids = [{'price': p, 'quantity': q} for p, q in zip(bid_prices, quantities)]
+            
+            return ojsonify({
+                'status': 'success',
+                'orderbook': {
+                    'asks': asks,
+                    'bids': bids,
+                    'instrument': instrument
+                }
+            })
+        else:
+            # Get real order book from API
+            result = bot.api.get_orderbook(instrument, depth)
             
-            if bot.config.api.sandbox:
-                # Generate demo order book data
-                current_price = bot.market_data.get(instrument).close if instrument in bot.market_data else 100000
-                
-                asks = []
-                bids = []
-                
-                for i in range(depth):
-                    # Generate asks (selling orders) above current price
-                    ask_price = current_price + (i + 1) * (current_price * 0.0001)
-                    ask_quantity = 0.1 + (i * 0.05)
-                    asks.append({'price': round(ask_price, 2), 'quantity': round(ask_quantity, 4)})
-                    
-                    # Generate bids (buying orders) below current price
-                    bid_price = current_price - (i + 1) * (current_price * 0.0001)
-                    bid_quantity = 0.1 + (i * 0.05)
-                    bids.append({'price': round(bid_price, 2), 'quantity': round(bid_quantity, 4)})
-                
-                return jsonify({
+            if result.get('code') == 0:
+                orderbook_data = result.get('result', {}).get('data', {})
+                return ojsonify({
                     'status': 'success',
-                    'orderbook': {
-                        'asks': asks,
-                        'bids': bids,
-                        'instrument': instrument
-                    }
+                    'orderbook': orderbook_data
                 })
             else:
-                # Get real order book from API
-                result = bot.api.get_orderbook(instrument, depth)
-                
-                if result.get('code') == 0:
-                    orderbook_data = result.get('result', {}).get('data', {})
-                    return jsonify({
-                        'status': 'success',
-                        'orderbook': orderbook_data
-                    })
-                else:
-                    return jsonify({
-                        'status': 'error',
-                        'message': result.get('message', 'Failed to get orderbook')
-                    })
-            
-        except Exception as e:
-            logger.error(f"Error getting orderbook for {instrument}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                return ojsonify({
+                    'status': 'error',
+                    'message': result.get('message', 'Failed to get orderbook')
+                })
 
     @app.route('/api/trades/<instrument>', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_recent_trades(instrument):
         """Get recent trades for specific instrument"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
+        count = _int_arg('count', 25)
+        
+        if bot.config.api.sandbox:
+            # Generate demo trade data
+            count = max(count, 0)
+            current_price = bot.market_data_prices.get(instrument) or 100000
+            
+            # Realistic trade data, drawn for all trades at once
+            prices = np.round(current_price * (1 + _rng.uniform(-0.001, 0.001, count)), 2).tolist()
+            quantities = np.round(_rng.uniform(0.01, 1.0, count), 4).tolist()
+            sides = TRADE_SIDES[_rng.integers(0, 2, count)].tolist()
+            now = datetime.now()
+            
+            trades = [
+                {
+                    'id': f'demo_{i}',
+                    'price': prices[i],
+                    'quantity': quantities[i],
+                    'side': sides[i],
+                    'time': (now - timedelta(minutes=i)).strftime('%H:%M:%S')
+                }
+                for i in range(count)
+            ]
             
-            count = request.args.get('count', 25, type=int)
+            return ojsonify({
+                'status': 'success',
+                'trades': trades
+            })
+        else:
+            # Get real trades from API
+            result = bot.api.get_trades(instrument, count)
             
-            if bot.config.api.sandbox:
-                # Generate demo trade data
-                import random
-                from datetime import datetime, timedelta
-                
-                trades = []
-                current_price = bot.market_data.get(instrument).close if instrument in bot.market_data else 100000
-                
-                for i in range(count):
-                    # Generate realistic trade data
-                    price_variation = current_price * random.uniform(-0.001, 0.001)
-                    trade_price = current_price + price_variation
-                    trade_quantity = random.uniform(0.01, 1.0)
-                    trade_side = random.choice(['BUY', 'SELL'])
-                    trade_time = (datetime.now() - timedelta(minutes=i)).strftime('%H:%M:%S')
-                    
-                    trades.append({
-                        'id': f'demo_{i}',
-                        'price': round(trade_price, 2),
-                        'quantity': round(trade_quantity, 4),
-                        'side': trade_side,
-                        'time': trade_time
-                    })
-                
-                return jsonify({
+            if result.get('code') == 0:
+                trades_data = result.get('result', {}).get('data', [])
+                return ojsonify({
                     'status': 'success',
-                    'trades': trades
+                    'trades': trades_data
                 })
             else:
-                # Get real trades from API
-                result = bot.api.get_trades(instrument, count)
-                
-                if result.get('code') == 0:
-                    trades_data = result.get('result', {}).get('data', [])
-                    return jsonify({
-                        'status': 'success',
-                        'trades': trades_data
-                    })
-                else:
-                    return jsonify({
-                        'status': 'error',
-                        'message': result.get('message', 'Failed to get trades')
-                    })
-            
-        except Exception as e:
-            logger.error(f"Error getting trades for {instrument}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                return ojsonify({
+                    'status': 'error',
+                    'message': result.get('message', 'Failed to get trades')
+                })
 
     @app.route('/api/candlestick/<instrument>', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_candlestick_data(instrument):
         """Get candlestick data for charting"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            timeframe = request.args.get('timeframe', '1h')
-            count = request.args.get('count', 100, type=int)
+        timeframe = request.args.get('timeframe', '1h')
+        count = _int_arg('count', 100)
+        
+        if bot.config.api.sandbox:
+            # Generate demo candlestick data
+            count = max(count, 0)
+            base_price = bot.market_data_prices.get(instrument) or 100000
+            
+            step_ms = TIMEFRAME_STEP_MS.get(timeframe, TIMEFRAME_STEP_MS['1h'])
+            
+            # Each candle opens off the previous close, so closes are a running product
+            price_change = _rng.uniform(-0.02, 0.02, count)  # ±2% change
+            close_change = _rng.uniform(-0.005, 0.005, count)  # ±0.5% from open
+            high_change = _rng.uniform(0, 0.01, count)  # Up to 1% higher
+            low_change = _rng.uniform(-0.01, 0, count)  # Up to 1% lower
+            volume = _rng.uniform(1000, 10000, count)
+            
+            close_price = base_price * np.cumprod((1 + price_change) * (1 + close_change))
+            open_price = np.concatenate(([base_price], close_price[:-1])) * (1 + price_change)
+            
+            # Ensure OHLC logic (high >= max(open, close), low <= min(open, close))
+            high_price = np.maximum.reduce([open_price * (1 + high_change), open_price, close_price])
+            low_price = np.minimum.reduce([open_price * (1 + low_change), open_price, close_price])
+            
+            timestamps = int(time.time() * 1000) - (count - np.arange(count)) * step_ms
+            
+            candlesticks = (
+                {'timestamp': t, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+                for t, o, h, l, c, v in zip(
+                    timestamps.tolist(),
+                    np.round(open_price, 2).tolist(),
+                    np.round(high_price, 2).tolist(),
+                    np.round(low_price, 2).tolist(),
+                    np.round(close_price, 2).tolist(),
+                    np.round(volume, 2).tolist()
+                )
+            )
             
-            if bot.config.api.sandbox:
-                # Generate demo candlestick data
-                import random
-                from datetime import datetime, timedelta
-                
-                candlesticks = []
-                base_price = bot.market_data.get(instrument).close if instrument in bot.market_data else 100000
-                
-                for i in range(count):
-                    # Generate OHLCV data
-                    time_offset = count - i
-                    if timeframe == '1m':
-                        candle_time = datetime.now() - timedelta(minutes=time_offset)
-                    elif timeframe == '1h':
-                        candle_time = datetime.now() - timedelta(hours=time_offset)
-                    elif timeframe == '1d':
-                        candle_time = datetime.now() - timedelta(days=time_offset)
-                    else:
-                        candle_time = datetime.now() - timedelta(hours=time_offset)
-                    
-                    # Generate realistic price movement
-                    price_change = random.uniform(-0.02, 0.02)  # ±2% change
-                    open_price = base_price * (1 + price_change)
-                    
-                    high_change = random.uniform(0, 0.01)  # Up to 1% higher
-                    low_change = random.uniform(-0.01, 0)  # Up to 1% lower
-                    close_change = random.uniform(-0.005, 0.005)  # ±0.5% from open
-                    
-                    high_price = open_price * (1 + high_change)
-                    low_price = open_price * (1 + low_change)
-                    close_price = open_price * (1 + close_change)
-                    
-                    # Ensure OHLC logic (high >= max(open, close), low <= min(open, close))
-                    high_price = max(high_price, open_price, close_price)
-                    low_price = min(low_price, open_price, close_price)
-                    
-                    volume = random.uniform(1000, 10000)
-                    
-                    candlesticks.append({
-                        'timestamp': int(candle_time.timestamp() * 1000),
-                        'open': round(open_price, 2),
-                        'high': round(high_price, 2),
-                        'low': round(low_price, 2),
-                        'close': round(close_price, 2),
-                        'volume': round(volume, 2)
-                    })
-                    
-                    base_price = close_price  # Use close as next base
+            return ostream({
+                'status': 'success',
+                'instrument': instrument,
+                'timeframe': timeframe
+            }, 'candlesticks', candlesticks)
+        else:
+            # Get real candlestick data from API
+            result = bot.api.get_candlestick(instrument, timeframe, count)
+            
+            if result.get('code') == 0:
+                candlestick_data = result.get('result', {}).get('data', [])
                 
-                return jsonify({
-                    'status': 'success',
-                    'candlesticks': candlesticks,
-                    'instrument': instrument,
-                    'timeframe': timeframe
-                })
-            else:
-                # Get real candlestick data from API
-                result = bot.api.get_candlestick(instrument, timeframe, count)
+                # The newest bar is still forming, so its close and volume are part of
+                # the tag along with its open time and the bar count
+                last_bar = candlestick_data[-1] if candlestick_data else {}
+                etag = (f"{instrument}-{timeframe}-{len(candlestick_data)}-"
+                        f"{last_bar.get('t')}-{last_bar.get('c')}-{last_bar.get('v')}")
                 
-                if result.get('code') == 0:
-                    candlestick_data = result.get('result', {}).get('data', [])
-                    return jsonify({
+                if request.if_none_match.contains_weak(etag):
+                    # Client already has this range; skip serializing it again
+                    response = app.response_class(status=304)
+                else:
+                    response = ojsonify({
                         'status': 'success',
                         'candlesticks': candlestick_data,
                         'instrument': instrument,
                         'timeframe': timeframe
                     })
-                else:
-                    return jsonify({
-                        'status': 'error',
-                        'message': result.get('message', 'Failed to get candlestick data')
-                    })
-            
-        except Exception as e:
-            logger.error(f"Error getting candlestick data for {instrument}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+                response.set_etag(etag, weak=True)
+                response.headers['Cache-Control'] = 'no-cache'
+                return response
+            else:
+                return ojsonify({
+                    'status': 'error',
+                    'message': result.get('message', 'Failed to get candlestick data')
+                })
 
     @app.route('/api/strategy/<strategy_name>/signals', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_strategy_signals(strategy_name):
         """Get recent signals from a specific strategy"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            if strategy_name not in bot.strategies:
-                return jsonify({
-                    'status': 'error', 
-                    'message': f'Strategy {strategy_name} not found'
-                })
-            
-            strategy = bot.strategies[strategy_name]
-            days = request.args.get('days', 7, type=int)
-            
-            # Get signal history if strategy supports it
-            if hasattr(strategy, 'get_signal_history'):
-                signals = strategy.get_signal_history(bot.config.trading.trading_pairs[0], days)
-                return jsonify({
-                    'status': 'success',
-                    'signals': signals,
-                    'strategy': strategy_name
-                })
-            else:
-                return jsonify({
-                    'status': 'success',
-                    'signals': [],
-                    'message': 'Strategy does not support signal history'
-                })
-            
-        except Exception as e:
-            logger.error(f"Error getting signals for {strategy_name}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        if strategy_name not in bot.strategies:
+            return ojsonify({
+                'status': 'error', 
+                'message': f'Strategy {strategy_name} not found'
+            })
+        
+        days = _int_arg('days', 7)
+        
+        # Get signal history if strategy supports it
+        get_signal_history = bot.strategy_methods[strategy_name]['signal_history']
+        if get_signal_history is not None:
+            signals = get_signal_history(bot.config.trading.trading_pairs[0], days)
+            return ojsonify({
+                'status': 'success',
+                'signals': signals,
+                'strategy': strategy_name
+            })
+        else:
+            return raw_json(_NO_SIGNAL_HISTORY)
 
     @app.route('/api/strategy/<strategy_name>/optimize', methods=['POST'])
+    @api_endpoint
+    @requires_bot
     def optimize_strategy(strategy_name):
         """Optimize strategy parameters"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            if strategy_name not in bot.strategies:
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Strategy {strategy_name} not found'
-                })
-            
-            strategy = bot.strategies[strategy_name]
-            data = request.get_json()
-            lookback_days = data.get('lookback_days', 30)
-            
-            # Optimize parameters if strategy supports it
-            if hasattr(strategy, 'optimize_parameters'):
-                optimized_config = strategy.optimize_parameters(
-                    bot.config.trading.trading_pairs[0], 
-                    lookback_days
-                )
-                
-                return jsonify({
-                    'status': 'success',
-                    'optimized_config': optimized_config,
-                    'strategy': strategy_name
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'message': 'Strategy does not support optimization'
-                })
-            
-        except Exception as e:
-            logger.error(f"Error optimizing {strategy_name}: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        if strategy_name not in bot.strategies:
+            return ojsonify({
+                'status': 'error',
+                'message': f'Strategy {strategy_name} not found'
+            })
+        
+        data = _json_body()
+        lookback_days = data.get('lookback_days', 30)
+        
+        # Optimize parameters if strategy supports it
+        optimize_parameters = bot.strategy_methods[strategy_name]['optimize_parameters']
+        if optimize_parameters is not None:
+            optimized_config = optimize_parameters(
+                bot.config.trading.trading_pairs[0], 
+                lookback_days
+            )
+            
+            return ojsonify({
+                'status': 'success',
+                'optimized_config': optimized_config,
+                'strategy': strategy_name
+            })
+        else:
+            return raw_json(_NO_OPTIMIZATION)
 
     @app.route('/api/risk/metrics', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def get_risk_metrics():
         """Get current risk metrics"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
+        def risk_payload():
             # Calculate portfolio risk metrics
             positions = bot.get_positions()
             balance = bot.get_account_balance()
             
-            total_exposure = 0
             position_count = len(positions)
-            
-            for instrument, position in positions.items():
-                current_price = bot.market_data.get(instrument).close if instrument in bot.market_data else 0
-                exposure = position['quantity'] * current_price
-                total_exposure += exposure
+            market_prices = bot.market_data_prices
+            
+            # Exposure is quantity . price over all positions, in one dot product
+            quantities = np.fromiter(
+                (position['quantity'] for position in positions.values()),
+                dtype=np.float64, count=position_count
+            )
+            prices = np.fromiter(
+                (market_prices.get(instrument, 0) for instrument in positions),
+                dtype=np.float64, count=position_count
+            )
+            total_exposure = float(np.dot(quantities, prices))
             
             # Calculate risk metrics
+            risk_config = bot.config.risk
+            total_balance = balance.get('total_balance', 1)
             risk_metrics = {
                 'total_exposure': total_exposure,
                 'available_balance': balance.get('available_balance', 0),
-                'exposure_ratio': (total_exposure / balance.get('total_balance', 1)) * 100,
+                'exposure_ratio': (total_exposure / total_balance) * 100,
                 'position_count': position_count,
-                'max_positions': bot.config.risk.max_open_positions,
-                'max_position_size': bot.config.risk.max_position_size,
-                'daily_loss_limit': bot.config.risk.max_daily_loss,
-                'leverage_used': total_exposure / max(balance.get('total_balance', 1), 1),
-                'max_leverage': bot.config.risk.max_leverage
+                'max_positions': risk_config.max_open_positions,
+                'max_position_size': risk_config.max_position_size,
+                'daily_loss_limit': risk_config.max_daily_loss,
+                'leverage_used': total_exposure / max(total_balance, 1),
+                'max_leverage': risk_config.max_leverage
             }
             
             # Add strategy-specific risk metrics
+            primary_pair = bot.config.trading.trading_pairs[0]
             strategy_risks = {}
-            for name, strategy in bot.strategies.items():
-                if hasattr(strategy, 'get_risk_metrics'):
-                    strategy_risks[name] = strategy.get_risk_metrics(
-                        bot.config.trading.trading_pairs[0]
-                    )
+            for name, methods in bot.strategy_methods.items():
+                if methods['risk_metrics'] is not None:
+                    strategy_risks[name] = methods['risk_metrics'](primary_pair)
             
-            return jsonify({
+            return {
                 'status': 'success',
                 'portfolio_risk': risk_metrics,
                 'strategy_risks': strategy_risks
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting risk metrics: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+            }
+        
+        return ojsonify(risk_cache.get('risk', risk_payload))
 
     @app.route('/api/notifications', methods=['GET'])
+    @api_endpoint
     def get_notifications():
         """Get recent notifications/alerts"""
-        try:
-            # This would typically come from a notification service
-            # For now, return demo notifications
-            notifications = [
-                {
-                    'id': 1,
-                    'type': 'trade',
-                    'message': 'BUY order executed: 0.1 BTCUSD-PERP @ $100,000',
-                    'timestamp': int(time.time() - 3600),
-                    'severity': 'info'
-                },
-                {
-                    'id': 2,
-                    'type': 'pnl',
-                    'message': 'Daily PnL target reached: +2.5%',
-                    'timestamp': int(time.time() - 7200),
-                    'severity': 'success'
-                },
-                {
-                    'id': 3,
-                    'type': 'risk',
-                    'message': 'Position size approaching limit',
-                    'timestamp': int(time.time() - 10800),
-                    'severity': 'warning'
-                }
-            ]
-            
-            return jsonify({
-                'status': 'success',
-                'notifications': notifications
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting notifications: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        # This would typically come from a notification service
+        # For now, return demo notifications
+        now = int(time.time())
+        return raw_json(_NOTIFICATIONS_TEMPLATE % (now - 3600, now - 7200, now - 10800))
 
     @app.route('/api/backup/export', methods=['GET'])
+    @api_endpoint
+    @requires_bot
     def export_data():
         """Export trading data for backup"""
-        try:
-            if not bot:
-                return jsonify({'status': 'error', 'message': 'Bot not available'})
-            
-            export_data = {
-                'config': bot.config.to_dict(),
-                'trading_history': getattr(bot, 'trading_history', []),
-                'performance': bot.get_performance_metrics(),
-                'strategies': bot.get_strategies_info(),
-                'export_timestamp': time.time()
-            }
-            
-            # Remove sensitive data
-            if 'api' in export_data['config']:
-                export_data['config']['api']['api_key'] = '[REDACTED]'
-                export_data['config']['api']['secret_key'] = '[REDACTED]'
-            
-            return jsonify({
-                'status': 'success',
-                'data': export_data
-            })
-            
-        except Exception as e:
-            logger.error(f"Error exporting data: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        nonlocal export_config
+        with config_lock:
+            version = bot.config.version
+            if export_config[0] != version:
+                config_dict = bot.config.to_dict()
+                
+                # Remove sensitive data
+                if 'api' in config_dict:
+                    config_dict['api']['api_key'] = '[REDACTED]'
+                    config_dict['api']['secret_key'] = '[REDACTED]'
+                
+                export_config = (version, config_dict)
+            redacted_config = export_config[1]
+        
+        # Everything but the trade history is small; encode it up front so
+        # errors still surface as a 500 before the stream starts
+        export_head = orjson.dumps({
+            'config': redacted_config,
+            'performance': bot.get_performance_metrics(),
+            'strategies': bot.get_strategies_info(),
+            'export_timestamp': time.time()
+        }, default=_json_default, option=ORJSON_OPTIONS)
+        # The bot keeps every trade encoded as it is recorded, so the history
+        # (possibly thousands of trades) is only joined and streamed here
+        history = bot.trading_history_json[:]
+        
+        def generate():
+            yield b'{"status":"success","data":' + export_head[:-1] + b',"trading_history":['
+            yield from join_encoded(history)
+            yield b']}}'
+        
+        return app.response_class(generate(), mimetype='application/json')
 
     @app.route('/api/system/stats', methods=['GET'])
+    @api_endpoint
     def get_system_stats():
         """Get system performance statistics"""
-        try:
-            import psutil
-            import os
-            
+        if psutil is None:
+            return raw_json(_PSUTIL_MISSING, 500)
+        
+        def host_stats():
             # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
-            # Get process metrics
-            process = psutil.Process(os.getpid())
-            process_memory = process.memory_info()
+            # Get process metrics in one batched /proc read
+            process_info = process.as_dict(attrs=['memory_info', 'num_threads'])
             
-            stats = {
+            return {
                 'system': {
                     'cpu_percent': cpu_percent,
                     'memory_percent': memory.percent,
@@ -951,50 +1135,76 @@ def create_api_routes(app: Flask, bot=None):
                     'disk_free_gb': disk.free / (1024**3)
                 },
                 'process': {
-                    'memory_mb': process_memory.rss / (1024**2),
-                    'threads': process.num_threads(),
-                    'uptime_seconds': time.time() - process.create_time()
-                },
-                'bot': {
-                    'running': bot.running if bot else False,
-                    'total_trades': getattr(bot, 'total_trades', 0),
-                    'active_strategies': len(getattr(bot, 'active_strategies', [])),
-                    'market_data_points': len(getattr(bot, 'market_data', {}))
+                    'memory_mb': process_info['memory_info'].rss / (1024**2),
+                    'threads': process_info['num_threads'],
+                    'uptime_seconds': time.time() - process_started
                 }
             }
-            
-            return jsonify({
-                'status': 'success',
-                'stats': stats
-            })
-            
-        except Exception as e:
-            logger.error(f"Error getting system stats: {e}")
-            return jsonify({'status': 'error', 'message': str(e)}), 500
+        
+        stats = {
+            **system_cache.get('host', host_stats),
+            'bot': {
+                'running': bot.running if bot else False,
+                'total_trades': getattr(bot, 'total_trades', 0),
+                'active_strategies': len(getattr(bot, 'active_strategies', [])),
+                'market_data_points': len(getattr(bot, 'market_data', {}))
+            }
+        }
+        
+        return ojsonify({
+            'status': 'success',
+            'stats': stats
+        })
+
+    @app.after_request
+    def compress_json(response):
+        """Compress JSON API responses, buffered or streamed, for clients that accept br or gzip"""
+        if (not request.path.startswith('/api/')
+                or response.mimetype != 'application/json'
+                or response.status_code < 200 or response.status_code in (204, 304)
+                or 'Content-Encoding' in response.headers):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        if not response.is_streamed and (response.content_length or 0) < COMPRESS_MIN_SIZE:
+            return response
+        
+        # Low levels: these bodies are rebuilt every poll, so speed beats ratio
+        accepted = request.accept_encodings
+        if brotli is not None and 'br' in accepted:
+            encoding, compressor = 'br', brotli.Compressor(quality=4)
+            compress, finish = compressor.process, compressor.finish
+        elif 'gzip' in accepted:
+            encoding, compressor = 'gzip', zlib.compressobj(5, zlib.DEFLATED, 31)
+            compress, finish = compressor.compress, compressor.flush
+        else:
+            return response
+        
+        if response.is_streamed:
+            def compressed(chunks):
+                for chunk in chunks:
+                    if out := compress(chunk):
+                        yield out
+                yield finish()
+            response.response = compressed(response.iter_encoded())
+            response.headers.pop('Content-Length', None)
+        else:
+            response.set_data(compress(response.get_data()) + finish())
+        response.headers['Content-Encoding'] = encoding
+        return response
 
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
-        return jsonify({
-            'status': 'error',
-            'message': 'Endpoint not found',
-            'code': 404
-        }), 404
+        return raw_json(_NOT_FOUND, 404)
 
     @app.errorhandler(500)
     def internal_error(error):
-        return jsonify({
-            'status': 'error',
-            'message': 'Internal server error',
-            'code': 500
-        }), 500
+        return raw_json(_INTERNAL_ERROR, 500)
 
     @app.errorhandler(400)
     def bad_request(error):
-        return jsonify({
-            'status': 'error',
-            'message': 'Bad request',
-            'code': 400
-        }), 400
+        return raw_json(_BAD_REQUEST, 400)
 
-    logger.info("Complete API routes created successfully with all endpoints")
\ No newline at end of file
+    logger.info("Complete API routes created successfully with all endpoints")
+    return clear_status_caches
\ No newline at end of file
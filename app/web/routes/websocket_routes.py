@@ -3,46 +3,55 @@ WebSocket Routes
 Handles real-time WebSocket communication for live updates.
 """
 
+from flask import request
 from flask_socketio import SocketIO, emit, disconnect
+import orjson
 import threading
-import time
 import logging
-from typing import Optional
+from typing import Callable, Optional
+
+from .api_routes import ORJSON_OPTIONS, QUOTE_FIELDS, TTLMemo
+from ..server import get_client_socket, tune_client_socket
 
 logger = logging.getLogger(__name__)
 
-def create_websocket_routes(socketio: SocketIO, bot=None):
+TICK_INTERVAL = 0.1  # seconds between batched 'tick' frames
+QUOTE_TTL = 0.2  # seconds a get_market_data reply is shared between requesters
+
+def create_websocket_routes(socketio: SocketIO, bot=None, clear_status_caches: Optional[Callable[[], None]] = None):
     """
     Create WebSocket event handlers
     
     Args:
         socketio: SocketIO instance
         bot: Trading bot instance
+        clear_status_caches: Drops the REST API's cached status readings
+            (from create_api_routes); called after a socket start/stop
     """
     
+    # Dashboards polling the same instrument share one encoded reply per QUOTE_TTL
+    quote_cache = TTLMemo(maxsize=128, ttl=QUOTE_TTL)
+    
     @socketio.on('connect')
     def handle_connect():
         """Handle client connection"""
         logger.info('Client connected to WebSocket')
+        tune_client_socket(get_client_socket(request.environ))
         emit('status', {'connected': True})
         
         # Send initial data
         if bot:
             try:
-                # Send bot status
-                status = bot.get_status()
-                emit('bot_status', status)
+                # Every real-time channel in one frame, shaped like the broadcast
+                # ticks; later ticks only carry what changed
+                emit('tick', snapshot_channels())
                 
                 # Send strategies
                 strategies = bot.get_strategies_info()
                 emit('strategies_update', strategies)
                 
-                # Send positions
-                positions = bot.get_positions()
-                emit('positions_update', positions)
-                
             except Exception as e:
-                logger.error(f"Error sending initial data: {e}")
+                logger.error("Error sending initial data: %s", e)
     
     @socketio.on('disconnect')
     def handle_disconnect():
@@ -54,14 +63,14 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
         """Handle subscription to real-time updates"""
         try:
             update_types = data.get('types', ['status', 'positions', 'strategies'])
-            logger.info(f'Client subscribed to updates: {update_types}')
+            logger.info('Client subscribed to updates: %s', update_types)
             
             # Start sending updates for this client
             # In a real implementation, you'd track client subscriptions
             emit('subscription_confirmed', {'types': update_types})
             
         except Exception as e:
-            logger.error(f"Error handling subscription: {e}")
+            logger.error("Error handling subscription: %s", e)
             emit('error', {'message': str(e)})
     
     @socketio.on('get_market_data')
@@ -71,20 +80,23 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
             instrument = data.get('instrument')
             
             if bot and instrument in bot.market_data:
-                market_data = bot.market_data[instrument]
-                emit('market_data', {
-                    'instrument': instrument,
-                    'timestamp': market_data.timestamp,
-                    'price': market_data.close,
-                    'volume': market_data.volume,
-                    'bid': market_data.bid,
-                    'ask': market_data.ask
-                })
+                def quote():
+                    price, volume, timestamp, bid, ask = QUOTE_FIELDS(bot.market_data[instrument])
+                    return orjson.Fragment(orjson.dumps({
+                        'instrument': instrument,
+                        'timestamp': timestamp,
+                        'price': price,
+                        'volume': volume,
+                        'bid': bid,
+                        'ask': ask
+                    }, default=str, option=ORJSON_OPTIONS))
+                
+                emit('market_data', quote_cache.get(instrument, quote))
             else:
                 emit('error', {'message': f'No market data for {instrument}'})
                 
         except Exception as e:
-            logger.error(f"Error getting market data: {e}")
+            logger.error("Error getting market data: %s", e)
             emit('error', {'message': str(e)})
     
     @socketio.on('bot_command')
@@ -100,6 +112,7 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
             if command == 'start':
                 if not bot.running:
                     bot.start()
+                    bot_toggled()
                     emit('command_result', {'command': 'start', 'success': True})
                 else:
                     emit('command_result', {'command': 'start', 'success': False, 'message': 'Already running'})
@@ -107,6 +120,7 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
             elif command == 'stop':
                 if bot.running:
                     bot.stop()
+                    bot_toggled()
                     emit('command_result', {'command': 'stop', 'success': True})
                 else:
                     emit('command_result', {'command': 'stop', 'success': False, 'message': 'Not running'})
@@ -115,7 +129,7 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
                 emit('error', {'message': f'Unknown command: {command}'})
                 
         except Exception as e:
-            logger.error(f"Error handling bot command: {e}")
+            logger.error("Error handling bot command: %s", e)
             emit('error', {'message': str(e)})
     
     @socketio.on('strategy_command')
@@ -154,41 +168,185 @@ def create_websocket_routes(socketio: SocketIO, bot=None):
             emit('strategies_update', strategies)
             
         except Exception as e:
-            logger.error(f"Error handling strategy command: {e}")
+            logger.error("Error handling strategy command: %s", e)
             emit('error', {'message': str(e)})
+
+    def bot_toggled():
+        """Keep REST status polls from reporting the previous running state"""
+        if clear_status_caches:
+            clear_status_caches()
+
+    def rpc_start(payload):
+        if bot.running:
+            return {'status': 'error', 'message': 'Bot already running'}
+        bot.start()
+        bot_toggled()
+        return {'status': 'success', 'message': 'Bot started'}
+
+    def rpc_stop(payload):
+        if not bot.running:
+            return {'status': 'error', 'message': 'Bot not running'}
+        bot.stop()
+        bot_toggled()
+        return {'status': 'success', 'message': 'Bot stopped'}
+
+    def rpc_enable_strategy(payload):
+        strategy_name = payload.get('strategy_name')
+        if not strategy_name:
+            return {'status': 'error', 'message': 'Strategy name required'}
+        bot.enable_strategy(strategy_name)
+        return {'status': 'success', 'message': f'Strategy {strategy_name} enabled'}
+
+    def rpc_disable_strategy(payload):
+        strategy_name = payload.get('strategy_name')
+        if not strategy_name:
+            return {'status': 'error', 'message': 'Strategy name required'}
+        bot.disable_strategy(strategy_name)
+        return {'status': 'success', 'message': f'Strategy {strategy_name} disabled'}
+
+    rpc_handlers = {
+        'start': rpc_start,
+        'stop': rpc_stop,
+        'enable_strategy': rpc_enable_strategy,
+        'disable_strategy': rpc_disable_strategy
+    }
+
+    @socketio.on('rpc')
+    def handle_rpc(msg):
+        """Run a dashboard action over the open socket; the return value is the ack"""
+        try:
+            op = (msg or {}).get('op')
+            handler = rpc_handlers.get(op)
+
+            if not handler:
+                return {'status': 'error', 'message': f'Unknown operation: {op}'}
+
+            if not bot:
+                return {'status': 'error', 'message': 'Bot not available'}
+
+            return handler(msg.get('payload') or {})
+
+        except Exception as e:
+            logger.error("Error handling rpc %s: %s", msg, e)
+            return {'status': 'error', 'message': str(e)}
+
+    # Latest payload per channel; everything queued inside one window is
+    # delivered to clients as a single 'tick' frame
+    pending_updates = {}
+    pending_lock = threading.Lock()
+    # Encoded form of what was last broadcast per channel (and per market data
+    # instrument), so unchanged payloads are never sent again
+    sent_payloads = {}
+    
+    def encode_if_changed(key, payload) -> Optional[orjson.Fragment]:
+        """
+        Encode payload once, as a fragment the orjson packet encoder splices in
+        verbatim; None if it matches what was last sent under key
+        """
+        encoded = orjson.dumps(payload, default=str, option=ORJSON_OPTIONS)
+        if sent_payloads.get(key) == encoded:
+            return None
+        sent_payloads[key] = encoded
+        return orjson.Fragment(encoded)
+    
+    def queue_update(channel: str, payload):
+        """Mark a channel dirty with its newest payload, unless nothing changed"""
+        with pending_lock:
+            fragment = encode_if_changed(channel, payload)
+            if fragment is not None:
+                pending_updates[channel] = fragment
+    
+    def queue_market_data(quotes: dict):
+        """Queue only the instruments whose quote changed; the dashboard merges them per symbol"""
+        with pending_lock:
+            for instrument, quote in quotes.items():
+                fragment = encode_if_changed(('market_data', instrument), quote)
+                if fragment is not None:
+                    pending_updates.setdefault('market_data', {})[instrument] = fragment
+    
+    def status_payload() -> dict:
+        """Bot status, shaped like the dashboard's performance state"""
+        status = bot.get_status()
+        return {
+            'running': status.get('running', False),
+            'totalPnl': status.get('total_pnl', 0),
+            'totalTrades': status.get('total_trades', 0),
+            'winRate': status.get('win_rate', 0),
+            'openPositions': status.get('open_positions', 0)
+        }
+    
+    def market_quotes(items) -> dict:
+        """Quote per instrument from (instrument, MarketData) pairs"""
+        return {
+            instrument: {
+                'timestamp': market_data.timestamp,
+                'price': market_data.close,
+                'volume': market_data.volume
+            }
+            for instrument, market_data in items
+        }
+    
+    def snapshot_channels() -> dict:
+        """Current payload of every real-time channel"""
+        return {
+            'bot_status': status_payload(),
+            'positions': bot.get_positions(),
+            # Market data for every instrument in one mapping
+            'market_data': market_quotes(tuple(bot.market_data.items()))
+        }
     
     def start_real_time_updates():
         """Start broadcasting real-time updates to all connected clients"""
+        # The market loop replaces an instrument's MarketData object on every
+        # ticker update, so identity shows which instruments have news without
+        # reading or encoding the rest
+        queued_market_data = {}
+        
         def update_loop():
             while True:
                 try:
-                    if bot and bot.running:
-                        # Broadcast bot status
-                        status = bot.get_status()
-                        socketio.emit('bot_status', status)
-                        
-                        # Broadcast positions
-                        positions = bot.get_positions()
-                        socketio.emit('positions_update', positions)
+                    # Rebuild only after the bot reported a change, at most every
+                    # 2s; clearing first means a change made while we read is
+                    # picked up on the next pass
+                    if bot and bot.state_changed.is_set():
+                        bot.state_changed.clear()
+                        queue_update('bot_status', status_payload())
+                        queue_update('positions', bot.get_positions())
                         
-                        # Broadcast market data
-                        for instrument, market_data in bot.market_data.items():
-                            socketio.emit('market_data_update', {
-                                'instrument': instrument,
-                                'timestamp': market_data.timestamp,
-                                'price': market_data.close,
-                                'volume': market_data.volume
-                            })
+                        fresh = [
+                            (instrument, market_data)
+                            for instrument, market_data in tuple(bot.market_data.items())
+                            if queued_market_data.get(instrument) is not market_data
+                        ]
+                        if fresh:
+                            queued_market_data.update(fresh)
+                            queue_market_data(market_quotes(fresh))
+                    
+                    socketio.sleep(2)  # Update every 2 seconds
+                    
+                except Exception as e:
+                    logger.error("Error in real-time update loop: %s", e)
+                    socketio.sleep(5)
+        
+        def flush_loop():
+            while True:
+                socketio.sleep(TICK_INTERVAL)
+                try:
+                    with pending_lock:
+                        if not pending_updates:
+                            continue
+                        batch = dict(pending_updates)
+                        pending_updates.clear()
                     
-                    time.sleep(2)  # Update every 2 seconds
+                    socketio.emit('tick', batch)
                     
                 except Exception as e:
-                    logger.error(f"Error in real-time update loop: {e}")
-                    time.sleep(5)
+                    logger.error("Error flushing real-time updates: %s", e)
         
-        # Start update thread
-        update_thread = threading.Thread(target=update_loop, daemon=True)
-        update_thread.start()
+        # Run on the server's own async mode (greenlets under gevent, daemon
+        # threads otherwise) so emits don't cross schedulers
+        socketio.start_background_task(update_loop)
+        socketio.start_background_task(flush_loop)
         logger.info("Real-time updates started")
     
     # Start real-time updates when WebSocket routes are created
@@ -0,0 +1,100 @@
+"""
+Web Server Bootstrap
+Listening socket setup and TCP tuning for serving the Flask/SocketIO application.
+"""
+
+import logging
+import socket
+import sys
+from typing import Optional
+
+from flask import Flask
+from werkzeug.serving import make_server
+
+logger = logging.getLogger(__name__)
+
+# Not exported by the socket module; this is the Linux value
+SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+def create_listener(host: str, port: int, backlog: int = 128, busy_poll_us: int = 0) -> socket.socket:
+    """
+    Create a listening TCP socket tuned for small, latency-sensitive frames
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        backlog: Pending connection queue length
+        busy_poll_us: Busy-poll the NIC this long on blocking reads (Linux, 0 = off)
+
+    Returns:
+        Bound, listening socket
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    # No SO_REUSEPORT: a second instance must fail with EADDRINUSE instead
+    # of sharing the port and running a second bot
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    # Accepted sockets inherit TCP_NODELAY from the listener on Linux
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    # Also inherited by accepted sockets. Trades CPU for receive latency, and
+    # raising it above net.core.busy_read needs CAP_NET_ADMIN
+    if busy_poll_us and sys.platform.startswith('linux'):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, busy_poll_us)
+        except OSError as e:
+            logger.warning(f"Could not enable busy polling: {e}")
+
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+def get_client_socket(environ: dict) -> Optional[socket.socket]:
+    """Return the raw client socket from a WSGI environ, if the server exposes one"""
+    for key in ('werkzeug.socket', 'gunicorn.socket'):
+        sock = environ.get(key)
+        if sock is not None:
+            return sock
+    return None
+
+def tune_client_socket(sock: Optional[socket.socket]):
+    """Disable Nagle and delayed ACKs on an accepted client socket"""
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError as e:
+        logger.debug("Could not tune client socket: %s", e)
+
+def run_server(app: Flask, host: str, port: int, busy_poll_us: int = 0):
+    """
+    Serve the application on a tuned listener with Werkzeug's threaded server
+
+    This is Werkzeug's development server; use run_gevent_server (main.py
+    --gevent) or gunicorn via wsgi.py for production.
+    """
+    listener = create_listener(host, port, busy_poll_us=busy_poll_us)
+    server = make_server(host, port, app, threaded=True, fd=listener.fileno())
+    logger.warning("Using Werkzeug's development server, which is not meant for production; "
+                   "start with --gevent or serve wsgi.py with gunicorn instead")
+    logger.info(f"Serving on http://{host}:{port}")
+    server.serve_forever()
+
+def run_gevent_server(app: Flask, host: str, port: int, busy_poll_us: int = 0):
+    """
+    Serve the application with gevent's WSGI server
+
+    Requests that wait on the exchange yield to other requests instead of
+    holding a thread. Expects the stdlib to be monkey-patched before import
+    (see main.py --gevent).
+    """
+    from gevent.pywsgi import WSGIServer
+
+    listener = create_listener(host, port, busy_poll_us=busy_poll_us)
+    server = WSGIServer(listener, app)
+    logger.info(f"Serving on http://{host}:{port} (gevent)")
+    server.serve_forever()
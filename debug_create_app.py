@@ -3,6 +3,7 @@
 Debug the create_app function to see why it's returning None
 """
 
+import ast
 import os
 import sys
 
@@ -62,38 +63,48 @@ def check_create_app_source():
         with open(app_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Find the create_app function
-        lines = content.split('\n')
-        in_create_app = False
-        create_app_lines = []
-        indent_level = 0
+        # Find the create_app function; the parser gives its exact extent,
+        # whatever its decorators, signature layout or nested functions
+        tree = ast.parse(content, filename=app_file)
+        func = next((node for node in tree.body
+                     if isinstance(node, ast.FunctionDef) and node.name == 'create_app'), None)
         
-        for i, line in enumerate(lines, 1):
-            if 'def create_app(' in line:
-                in_create_app = True
-                indent_level = len(line) - len(line.lstrip())
-                create_app_lines.append(f"{i:3d}: {line}")
-            elif in_create_app:
-                current_indent = len(line) - len(line.lstrip()) if line.strip() else indent_level + 1
-                
-                if line.strip() and current_indent <= indent_level:
-                    # We've left the function
-                    break
-                    
-                create_app_lines.append(f"{i:3d}: {line}")
-        
-        if create_app_lines:
+        if func:
+            returns = _own_returns(func)
+            return_lines = {node.lineno for node in returns}
+            lines = content.splitlines()[func.lineno - 1:func.end_lineno]
+            
             print("📋 create_app function:")
-            for line in create_app_lines[-20:]:  # Show last 20 lines
-                if 'return' in line:
-                    print(f"🎯 {line}")  # Highlight return statements
+            first_shown = max(func.lineno, func.end_lineno - 19)  # Show last 20 lines
+            for i, line in enumerate(lines[first_shown - func.lineno:], first_shown):
+                if i in return_lines:
+                    print(f"🎯 {i:3d}: {line}")  # Highlight return statements
                 else:
-                    print(f"   {line}")
+                    print(f"   {i:3d}: {line}")
+            
+            if not returns or any(_returns_none(node) for node in returns):
+                print("⚠️ create_app has a path that returns None")
         else:
             print("❌ create_app function not found")
     else:
         print(f"❌ {app_file} not found")
 
+def _own_returns(func: ast.FunctionDef) -> list:
+    """Return statements of func itself, not of functions or classes nested in it"""
+    returns = []
+    pending = list(func.body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.Return):
+            returns.append(node)
+        elif not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            pending.extend(ast.iter_child_nodes(node))
+    return returns
+
+def _returns_none(node: ast.Return) -> bool:
+    """True for a bare `return` or `return None`"""
+    return node.value is None or (isinstance(node.value, ast.Constant) and node.value.value is None)
+
 def main():
     """Main function"""
     test_create_app()
@@ -4,11 +4,29 @@ Complete Import Diagnosis and Fix Tool
 This will help identify and fix all import issues in the CryptoPro project
 """
 
+import ast
 import os
 import sys
 import importlib
+import importlib.util
 from pathlib import Path
 
+SUGGESTED_FIXES = (
+    "1. Ensure all __init__.py files exist and are not empty",
+    "2. Use absolute imports throughout the project",
+    "3. Remove any sys.path modifications", 
+    "4. Check for circular imports",
+    "5. Verify Python is run from the project root directory",
+    "6. Check for syntax errors in route files"
+)
+
+SPECIFIC_ACTIONS = (
+    "A. Add content to empty __init__.py files",
+    "B. Replace relative imports with absolute imports",
+    "C. Run: python -c 'import app.web.routes.websocket_routes'",
+    "D. Check if there are any circular import dependencies"
+)
+
 def check_init_files():
     """Ensure all required __init__.py files exist and have content"""
     init_files = [
@@ -25,14 +43,17 @@ def check_init_files():
     print("=" * 50)
     
     for init_file in init_files:
-        if os.path.exists(init_file):
-            size = os.path.getsize(init_file)
-            if size > 0:
-                print(f"✅ {init_file:<35} OK ({size} bytes)")
-            else:
-                print(f"⚠️  {init_file:<35} EMPTY - This might cause issues")
-        else:
+        # One stat per file answers both "exists?" and "how big?"
+        try:
+            size = os.stat(init_file).st_size
+        except FileNotFoundError:
             print(f"❌ {init_file:<35} MISSING")
+            continue
+        
+        if size > 0:
+            print(f"✅ {init_file:<35} OK ({size} bytes)")
+        else:
+            print(f"⚠️  {init_file:<35} EMPTY - This might cause issues")
             
 def test_individual_modules():
     """Test importing each module individually"""
@@ -113,30 +134,26 @@ def check_app_web_app_imports():
         try:
             with open(app_file, 'r') as f:
                 content = f.read()
-                
-            # Find import lines
-            import_lines = []
-            for i, line in enumerate(content.split('\n'), 1):
-                line = line.strip()
-                if line.startswith('from ') or line.startswith('import '):
-                    import_lines.append((i, line))
+            
+            # Import statements straight from the syntax tree, in source order
+            tree = ast.parse(content, filename=app_file)
+            import_nodes = sorted(
+                (node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))),
+                key=lambda node: node.lineno
+            )
                     
             print("📋 Import statements found:")
-            for line_num, import_stmt in import_lines:
-                print(f"   Line {line_num:2d}: {import_stmt}")
+            for node in import_nodes:
+                import_stmt = ast.unparse(node)
+                print(f"   Line {node.lineno:2d}: {import_stmt}")
                 
-                # Test each import
-                if 'websocket_routes' in import_stmt or 'api_routes' in import_stmt:
+                # Test each route module import (relative ones resolved against app.web)
+                if isinstance(node, ast.ImportFrom) and node.module and 'routes' in node.module:
+                    module = importlib.util.resolve_name('.' * node.level + node.module, 'app.web')
                     print(f"   🧪 Testing: {import_stmt}")
                     try:
-                        # This is a simplified test - we can't easily exec the import
-                        # but we can check if the modules exist
-                        if 'from app.web.routes.websocket_routes' in import_stmt:
-                            import app.web.routes.websocket_routes
-                            print("   ✅ websocket_routes import should work")
-                        elif 'from app.web.routes.api_routes' in import_stmt:
-                            import app.web.routes.api_routes
-                            print("   ✅ api_routes import should work")
+                        importlib.import_module(module)
+                        print(f"   ✅ {module} import should work")
                     except Exception as e:
                         print(f"   ❌ Import test failed: {e}")
                         
@@ -149,24 +166,10 @@ def suggest_fixes():
     """Provide specific fix suggestions"""
     print("\n💡 SUGGESTED FIXES")
     print("=" * 50)
-    
-    fixes = [
-        "1. Ensure all __init__.py files exist and are not empty",
-        "2. Use absolute imports throughout the project",
-        "3. Remove any sys.path modifications", 
-        "4. Check for circular imports",
-        "5. Verify Python is run from the project root directory",
-        "6. Check for syntax errors in route files"
-    ]
-    
-    for fix in fixes:
-        print(f"   {fix}")
+    print("\n".join(f"   {fix}" for fix in SUGGESTED_FIXES))
         
     print("\n🔧 SPECIFIC ACTIONS TO TRY:")
-    print("   A. Add content to empty __init__.py files")
-    print("   B. Replace relative imports with absolute imports")
-    print("   C. Run: python -c 'import app.web.routes.websocket_routes'")
-    print("   D. Check if there are any circular import dependencies")
+    print("\n".join(f"   {action}" for action in SPECIFIC_ACTIONS))
 
 def main():
     """Run the complete diagnostic"""
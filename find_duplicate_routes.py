@@ -3,9 +3,53 @@
 Find duplicate route definitions in the Flask application
 """
 
+import ast
 import os
-import re
-from pathlib import Path
+import tokenize
+from collections import defaultdict
+
+# Layout-only tokens; dropping them (and comments) leaves the code tokens in order
+SKIP_TOKENS = {tokenize.ENCODING, tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE,
+               tokenize.INDENT, tokenize.DEDENT}
+
+def scan_routes(file_path):
+    """
+    Yield (line, route_path, methods, function_name) for every @app.route in a file
+
+    Works on the token stream, so routes quoted in strings or commented out
+    are never picked up, and a route's decorator arguments may span lines.
+    """
+    with open(file_path, 'rb') as f:
+        tokens = [tok for tok in tokenize.tokenize(f.readline) if tok.type not in SKIP_TOKENS]
+    
+    for i in range(len(tokens) - 5):
+        if ([tok.string for tok in tokens[i:i + 5]] != ['@', 'app', '.', 'route', '(']
+                or tokens[i + 5].type != tokenize.STRING):
+            continue
+        
+        route_path = ast.literal_eval(tokens[i + 5].string)
+        
+        # Walk the rest of the call, collecting the strings in methods=[...]
+        methods = []
+        depth, j, in_methods = 1, i + 5, False
+        while depth:
+            j += 1
+            tok = tokens[j]
+            if tok.type == tokenize.OP and tok.string in ('(', '['):
+                depth += 1
+            elif tok.type == tokenize.OP and tok.string in (')', ']'):
+                depth -= 1
+                in_methods = in_methods and depth > 1
+            elif tok.type == tokenize.NAME and tok.string == 'methods' and depth == 1:
+                in_methods = True
+            elif in_methods and tok.type == tokenize.STRING:
+                methods.append(ast.literal_eval(tok.string))
+        
+        # Any further decorators come before the decorated function's def
+        while tokens[j].string != 'def':
+            j += 1
+        
+        yield tokens[i].start[0], route_path, methods or ['GET'], tokens[j + 1].string
 
 def find_route_definitions():
     """Find all @app.route definitions in the project"""
@@ -19,39 +63,19 @@ def find_route_definitions():
     print("🔍 SEARCHING FOR ROUTE DEFINITIONS")
     print("=" * 60)
     
-    all_routes = {}  # route_path -> [(file, line_num, function_name)]
+    all_routes = defaultdict(list)  # (route_path, method) -> [(file, line_num, function_name)]
     
     for file_path in files_to_check:
         if os.path.exists(file_path):
             print(f"\n📄 Checking {file_path}")
             print("-" * 40)
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
+            for i, route_path, methods, function_name in scan_routes(file_path):
+                print(f"   Line {i:3d}: {route_path} [{', '.join(methods)}] -> {function_name}()")
                 
-                # Look for @app.route decorators
-                route_match = re.search(r"@app\.route\(['\"]([^'\"]+)['\"]", line)
-                if route_match:
-                    route_path = route_match.group(1)
-                    
-                    # Look for the function definition on the next few lines
-                    function_name = "unknown"
-                    for j in range(i, min(i + 5, len(lines))):
-                        func_line = lines[j].strip()
-                        func_match = re.search(r"def\s+(\w+)\s*\(", func_line)
-                        if func_match:
-                            function_name = func_match.group(1)
-                            break
-                    
-                    print(f"   Line {i:3d}: {route_path} -> {function_name}()")
-                    
-                    # Store in our tracking dict
-                    if route_path not in all_routes:
-                        all_routes[route_path] = []
-                    all_routes[route_path].append((file_path, i, function_name))
+                # The same path may be registered once per HTTP method
+                for method in methods:
+                    all_routes[(route_path, method)].append((file_path, i, function_name))
         else:
             print(f"❌ {file_path} not found")
     
@@ -59,10 +83,10 @@ def find_route_definitions():
     print("=" * 60)
     
     duplicates_found = False
-    for route_path, definitions in all_routes.items():
+    for (route_path, method), definitions in all_routes.items():
         if len(definitions) > 1:
             duplicates_found = True
-            print(f"\n❌ DUPLICATE ROUTE: {route_path}")
+            print(f"\n❌ DUPLICATE ROUTE: {method} {route_path}")
             for file_path, line_num, func_name in definitions:
                 print(f"   {file_path}:{line_num} -> {func_name}()")
     
@@ -71,11 +95,11 @@ def find_route_definitions():
     else:
         print(f"\n💡 SOLUTION:")
         print("Remove or rename one of the duplicate route definitions.")
-        print("Each route path should only be defined once.")
+        print("Each route path should only be defined once per HTTP method.")
     
     print(f"\n📊 SUMMARY")
     print("=" * 30)
-    print(f"Total unique routes: {len(all_routes)}")
+    print(f"Total unique routes: {len({route_path for route_path, method in all_routes})}")
     print(f"Duplicate routes: {sum(1 for defs in all_routes.values() if len(defs) > 1)}")
     
     return all_routes
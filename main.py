@@ -8,16 +8,19 @@ import os
 import sys
 import argparse
 import logging
+import signal
+import threading
 from pathlib import Path
 
+# gevent has to patch the socket/threading modules before requests/urllib3
+# (used by the exchange client) are imported, so this can't wait for argparse
+if '--gevent' in sys.argv:
+    from gevent import monkey
+    monkey.patch_all()
+
 # DO NOT add app directory to Python path - use proper imports instead
 # sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))  # ❌ REMOVE THIS
 
-from app.web.app import create_app
-from app.core.bot import TradingBot
-from app.utils.config import Config
-from app.utils.logger import setup_logging
-
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='CryptoBot Pro Trading Bot')
@@ -36,12 +39,23 @@ def parse_arguments():
     parser.add_argument('--no-web', 
                        action='store_true',
                        help='Run bot without web interface')
+    parser.add_argument('--gevent', 
+                       action='store_true',
+                       help='Serve the web interface with gevent (requires gevent)')
+    parser.add_argument('--busy-poll', 
+                       type=int, default=0, metavar='USEC',
+                       help='Busy-poll client sockets for USEC microseconds (Linux, needs CAP_NET_ADMIN)')
     return parser.parse_args()
 
 def main():
     """Main application entry point."""
     args = parse_arguments()
     
+    # Imported after argument parsing so --help doesn't load the bot stack
+    from app.core.bot import TradingBot
+    from app.utils.config import Config
+    from app.utils.logger import setup_logging
+    
     # Setup logging
     log_level = logging.DEBUG if args.debug else logging.INFO
     setup_logging(log_level)
@@ -56,24 +70,36 @@ def main():
         # Initialize trading bot
         bot = TradingBot(config)
         
-        # Create Flask app with bot instance
-        app = create_app(config, bot)
+        # Create Flask app with bot instance; headless runs never import the web stack
+        if not args.no_web:
+            from app.web.app import create_app
+            from app.web.server import run_gevent_server, run_server
+            
+            app = create_app(config, bot)
         
         # Start the bot
         bot.start()
         
         if not args.no_web:
             logger.info(f"Starting web interface on http://{args.host}:{args.port}")
-            app.run(host=args.host, port=args.port, debug=args.debug)
+            if args.debug:
+                app.run(host=args.host, port=args.port, debug=True)
+            elif args.gevent:
+                run_gevent_server(app, args.host, args.port, busy_poll_us=args.busy_poll)
+            else:
+                run_server(app, args.host, args.port, busy_poll_us=args.busy_poll)
         else:
             logger.info("Running in headless mode (no web interface)")
-            # Keep the bot running
-            try:
-                while True:
-                    import time
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                logger.info("Shutting down...")
+            # Keep the bot running until SIGINT/SIGTERM, without waking up in
+            # between; Windows can't interrupt a blocking wait, so it polls
+            stop_requested = threading.Event()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *_: stop_requested.set())
+            
+            timeout = None if os.name == 'posix' else 1.0
+            while not stop_requested.wait(timeout):
+                pass
+            logger.info("Shutting down...")
         
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+CryptoBot Pro - WSGI Entry Point
+Serve the bot and web interface under gunicorn's gevent worker:
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 -b 0.0.0.0:5000 wsgi:application
+
+Keep a single worker: every worker process would start its own trading bot,
+and Socket.IO sessions can't move between workers without a message queue.
+Don't use --preload either, the bot's threads don't survive the fork.
+"""
+
+# gevent has to patch the socket/threading modules before requests/urllib3
+# (used by the exchange client) are imported. gunicorn's gevent worker has
+# already done this; patching again is a no-op.
+from gevent import monkey
+monkey.patch_all()
+
+import atexit
+import logging
+import os
+
+from app.web.app import create_app
+from app.core.bot import TradingBot
+from app.utils.config import Config
+from app.utils.logger import setup_logging
+
+setup_logging(logging.INFO)
+
+config = Config(os.environ.get('CRYPTOBOT_CONFIG', 'config/config.yaml'))
+bot = TradingBot(config)
+application = create_app(config, bot)
+
+bot.start()
+atexit.register(bot.stop)